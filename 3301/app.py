@@ -1,14 +1,145 @@
-from flask import Flask, jsonify, request, render_template
-from ecdsa import SigningKey, NIST384p
-from c3301_blockchain import Blockchain, Wallet, Transaction
+from flask import Flask, Response, jsonify, make_response, request, render_template, send_from_directory, url_for
+import c3301_crypto
+import build_static
+from c3301_blockchain import Blockchain, Wallet, Transaction, MAX_ADDRESS_LENGTH, is_finite_number
+from c3301_admission import AdmissionQueue
+from c3301_forger import AutoForger
+from c3301_keypool import KeyPool
+from c3301_ratelimit import RateLimiter
+from werkzeug.middleware.proxy_fix import ProxyFix
 from argparse import ArgumentParser
+import gzip
+import json
+import mimetypes
+import os
+import queue
+import threading
+import time
+import requests
 
 app = Flask(__name__)
-blockchain = Blockchain()
+# One process owns the chain: the 'writer' (the default, and the only role a single-process node needs).
+# Any number of 'reader' processes - e.g. `C3301_ROLE=reader C3301_WRITER_URL=http://127.0.0.1:5001 gunicorn -w 8 --threads 32 app:app` -
+# serve queries from the writer's block store and mempool journal and forward everything that mutates state to the writer.
+# Every open /app or /explorer page holds a GET /events stream, so run threaded (--threads) or async workers, or serve
+# through asgi.py; a sync worker would be tied up by a single stream, so stream_events refuses to run on one.
+# The writer itself must run as a single process (`python app.py -p 5001`, or gunicorn -w 1 with threads).
+ROLE = os.getenv('C3301_ROLE', 'writer')
+if ROLE not in ('writer', 'reader'): raise SystemExit(f"C3301_ROLE must be 'writer' or 'reader', not {ROLE!r}")
+WRITER_URL = os.getenv('C3301_WRITER_URL', '').rstrip('/')
+if ROLE == 'reader' and not WRITER_URL: raise SystemExit("C3301_ROLE=reader needs C3301_WRITER_URL to forward writes to.")
+READER_REFRESH_INTERVAL = float(os.getenv('C3301_REFRESH_INTERVAL', 0.25))
+
+blockchain = Blockchain(read_only=ROLE == 'reader')
+# Fork the signature-check workers now, while this is the only thread in the process
+if ROLE == 'writer': c3301_crypto.start_verify_pool()
+key_pool = KeyPool(size=int(os.getenv('C3301_KEY_POOL_SIZE', 32)), refill_rate=float(os.getenv('C3301_KEY_POOL_RATE', 10))).start()
+admission, auto_forger = None, None
+if ROLE == 'writer':
+    admission = AdmissionQueue(blockchain, workers=int(os.getenv('C3301_ADMISSION_WORKERS', 1)), max_queue=int(os.getenv('C3301_ADMISSION_QUEUE', 10000))).start()
+    # Automatic forging is enabled by naming the address that collects the fees
+    if os.getenv('C3301_FORGER_ADDRESS'):
+        auto_forger = AutoForger(blockchain, os.getenv('C3301_FORGER_ADDRESS'), max_pending=int(os.getenv('C3301_FORGE_MAX_PENDING', 100)), max_age=float(os.getenv('C3301_FORGE_MAX_AGE', 30))).start()
+
+# --- Rate Limiting ---
+# route -> (per-client requests/s, per-client burst, global requests/s, global burst) for the endpoints that cost CPU or chain work
+RATE_LIMITS = {
+    'mint_coin': (1, 5, 20, 50),
+    'new_transaction': (10, 20, 200, 400),
+    'new_transaction_batch': (1, 3, 10, 20),
+    'sign_transaction_request': (5, 10, 100, 200),
+    'sign_transaction_batch': (1, 2, 5, 10),
+    'get_wallet': (1, 5, 20, 40),
+    'forge_block': (1, 2, 5, 10),
+    'stream_events': (1, 5, 50, 100),
+    'get_addresses_info': (2, 5, 20, 40),
+}
+rate_limiter = RateLimiter(RATE_LIMITS if os.getenv('C3301_RATE_LIMIT', '1') != '0' else {}, max_clients=int(os.getenv('C3301_RATE_LIMIT_CLIENTS', 100000)))
+# Behind a reverse proxy (or as the writer behind reader processes) set this to the number of proxies so
+# client addresses come from X-Forwarded-For instead of the proxy's own address
+TRUSTED_PROXIES = int(os.getenv('C3301_TRUSTED_PROXIES', 0))
+if TRUSTED_PROXIES: app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXIES)
+
+def rate_limited(wait):
+    response = jsonify({'message': 'Too many requests, slow down.', 'retry_after': round(wait, 3)})
+    response.status_code = 429; response.headers['Retry-After'] = RateLimiter.retry_after_header(wait)
+    return response
+
+# Registered before the reader role hook so readers turn floods away before forwarding them
+@app.before_request
+def apply_rate_limits():
+    wait = rate_limiter.check(request.endpoint, request.remote_addr)
+    return rate_limited(wait) if wait else None
+
+@app.route('/ratelimit', methods=['GET'])
+def get_rate_limit_stats(): return jsonify(rate_limiter.stats()), 200
+
+# --- Reader Role ---
+# Endpoints that change the chain or mempool, or report state only the writer holds
+WRITER_ENDPOINTS = {'new_transaction', 'new_transaction_batch', 'forge_block', 'mint_coin', 'get_forger_stats', 'get_transaction_status', 'get_admission_stats'}
+_last_refresh, _last_refresh_lock = 0.0, threading.Lock()
+
+def forward_to_writer():
+    headers = {'Content-Type': request.content_type} if request.content_type else {}
+    headers['X-Forwarded-For'] = request.remote_addr or ''
+    try: upstream = requests.request(request.method, WRITER_URL + request.full_path, data=request.get_data(), headers=headers, timeout=30)
+    except requests.RequestException as e: return jsonify({'message': f'Writer node unavailable: {e}'}), 502
+    return Response(upstream.content, upstream.status_code, content_type=upstream.headers.get('Content-Type'))
+
+def refresh_reader():
+    """Catches up with the writer at most every READER_REFRESH_INTERVAL seconds; a check with nothing new is one index lookup and one stat()."""
+    global _last_refresh
+    with _last_refresh_lock:
+        if time.time() - _last_refresh < READER_REFRESH_INTERVAL: return
+        _last_refresh = time.time()
+    blockchain.refresh()
+
+@app.before_request
+def serve_reader_role():
+    if ROLE != 'reader': return None
+    if request.endpoint in WRITER_ENDPOINTS: return forward_to_writer()
+    refresh_reader()
+    return None
+
+# --- Compression and Static Assets ---
+GZIP_MIN_BYTES = int(os.getenv('C3301_GZIP_MIN_BYTES', 1024))
+GZIP_LEVEL = 5  # most of the saving for hex-heavy JSON at a fraction of level 9's CPU
+
+@app.after_request
+def compress_response(response):
+    """Gzips JSON responses above GZIP_MIN_BYTES for clients that accept it. Streamed responses (NDJSON, SSE) are left alone."""
+    if response.mimetype != 'application/json' or response.is_streamed or response.status_code != 200 or 'Content-Encoding' in response.headers: return response
+    response.vary.add('Accept-Encoding')
+    if 'gzip' not in request.accept_encodings or response.content_length is None or response.content_length < GZIP_MIN_BYTES: return response
+    response.set_data(gzip.compress(response.get_data(), compresslevel=GZIP_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    # The compressed bytes are a different representation, so a strong ETag on them must become weak
+    etag, weak = response.get_etag()
+    if etag and not weak: response.set_etag(etag, weak=True)
+    return response
+
+# Built by build_static.py; without a build the templates fall back to the plain /static files
+try:
+    with open(os.path.join(build_static.DIST_DIR, build_static.MANIFEST_NAME)) as f: asset_manifest = json.load(f)
+except (OSError, ValueError): asset_manifest = {}
+
+@app.template_global()
+def asset_url(name):
+    hashed = asset_manifest.get(name)
+    return url_for('hashed_asset', filename=hashed) if hashed else url_for('static', filename=name)
+
+@app.route('/assets/<path:filename>')
+def hashed_asset(filename):
+    """Content-hashed build output. The name changes with the content, so it can be cached forever; the .gz is served when accepted."""
+    precompressed = 'gzip' in request.accept_encodings and os.path.isfile(os.path.join(build_static.DIST_DIR, filename + '.gz'))
+    response = send_from_directory(build_static.DIST_DIR, filename + '.gz' if precompressed else filename, mimetype=mimetypes.guess_type(filename)[0])
+    if precompressed: response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding'); response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
 
 # --- Frontend Routes ---
 @app.route('/')
-def landing_page(): return render_template('landing.html')
+def landing_page(): return render_template('landing.html', stats=blockchain.get_stats())
 @app.route('/app')
 def app_ui(): return render_template('app.html')
 @app.route('/explorer')
@@ -17,38 +148,151 @@ def explorer_ui(): return render_template('explorer.html')
 # --- API Endpoints ---
 @app.route('/wallet', methods=['GET'])
 def get_wallet():
-    wallet = Wallet()
+    wallet = Wallet(private_key=key_pool.get())
     return jsonify({ 'public_address': wallet.address, 'private_key': wallet.private_key.to_string().hex() }), 200
 
+@app.route('/wallet/pool', methods=['GET'])
+def get_wallet_pool_stats(): return jsonify(key_pool.stats()), 200
+
+# --- Conditional GET ---
+# Blocks never change once appended, so the tip hash identifies the state behind any chain-derived response
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+def conditional(etag, build, cache_control='no-cache'):
+    """Answers 304 if the client already holds `etag`, without calling build(); otherwise tags the response build() returns."""
+    if request.if_none_match.contains_weak(etag): response = Response(status=304)
+    else: response = make_response(build())
+    response.set_etag(etag); response.headers['Cache-Control'] = cache_control
+    return response
+
+# --- Pre-serialised Responses ---
+def json_object(status=200, **fields):
+    """A JSON object response assembled from parts: bytes values (cached block JSON) are spliced in as-is, anything else is encoded."""
+    body = b','.join(json.dumps(key).encode() + b':' + (value if isinstance(value, bytes) else json.dumps(value).encode()) for key, value in sorted(fields.items()))
+    return Response(b'{' + body + b'}', status, mimetype='application/json')
+
+def json_blocks(blocks): return b'[' + b','.join(blockchain.block_json.get(block) for block in blocks) + b']'
+
+CHAIN_PAGE_LIMIT = int(os.getenv('C3301_CHAIN_PAGE_LIMIT', 500))
+STREAM_CHUNK_BLOCKS = 100
+
+def chain_range(args, height, max_limit):
+    """
+    Resolves the start/limit/from_tip query parameters into (indexes, newest_first).
+    By default `start` is a block index and blocks come oldest first; with from_tip it counts back from the latest block (0 = tip)
+    and blocks come newest first. Raises ValueError on malformed parameters.
+    """
+    start, from_tip = int(args.get('start', 0)), args.get('from_tip', '').lower() in ('1', 'true', 'yes')
+    limit = int(args.get('limit', height))
+    if start < 0 or limit < 0: raise ValueError("start and limit must not be negative")
+    if max_limit is not None: limit = min(limit, max_limit)
+    if from_tip:
+        stop = max(height - start, 0)
+        return range(stop - 1, max(stop - limit, 0) - 1, -1), True
+    return range(min(start, height), min(start + limit, height)), False
+
+def stream_blocks(indexes):
+    """Yields one JSON document per block (NDJSON), fetching STREAM_CHUNK_BLOCKS at a time so memory stays bounded."""
+    for offset in range(0, len(indexes), STREAM_CHUNK_BLOCKS):
+        chunk = indexes[offset:offset + STREAM_CHUNK_BLOCKS]
+        blocks = blockchain.get_blocks(min(chunk[0], chunk[-1]), max(chunk[0], chunk[-1]) + 1)
+        if chunk.step < 0: blocks.reverse()
+        yield b''.join(blockchain.block_json.get(block) + b"\n" for block in blocks)
+
 @app.route('/chain', methods=['GET'])
 def get_chain():
-    chain_data = [vars(block) for block in blockchain.chain]
-    return jsonify({'chain': chain_data, 'length': len(chain_data)}), 200
+    """
+    A page of at most CHAIN_PAGE_LIMIT blocks, selected with start/limit/from_tip (see chain_range).
+    With ?format=ndjson the selected range - the whole chain if no limit is given - is streamed one block per line instead.
+    """
+    tip = blockchain.latest_block
+    height, stream = tip.index + 1, request.args.get('format') == 'ndjson'
+    try: indexes, newest_first = chain_range(request.args, height, None if stream else CHAIN_PAGE_LIMIT)
+    except ValueError: return jsonify({'message': 'start and limit must be non-negative integers'}), 400
+    if stream: return conditional(tip.hash, lambda: Response(stream_blocks(indexes), mimetype='application/x-ndjson'))
+
+    def build():
+        blocks = blockchain.get_blocks(min(indexes), max(indexes) + 1) if indexes else []
+        if newest_first: blocks.reverse()
+        following = indexes[-1] + indexes.step if indexes else None
+        next_start = (height - following - 1 if newest_first else following) if indexes and 0 <= following < height else None
+        return json_object(chain=json_blocks(blocks), length=height, count=len(blocks), next_start=next_start)
+    return conditional(tip.hash, build)
+
+@app.route('/chain/since/<block_hash>', methods=['GET'])
+def get_chain_since(block_hash):
+    """
+    The blocks after `block_hash`, oldest first, at most `limit` (capped at CHAIN_PAGE_LIMIT) per call; while `more`
+    is true, call again with the last hash received. If block_hash is not on this chain the client is on a fork:
+    the response sets `fork` and syncs from the newest of the comma-separated `locator` hashes (the client's own
+    recent block hashes, newest first) that is on this chain - the common ancestor. 404 if none of them are.
+    """
+    tip = blockchain.latest_block
+    locator = [h for h in request.args.get('locator', '').split(',') if h]
+    try: limit = min(int(request.args.get('limit', CHAIN_PAGE_LIMIT)), CHAIN_PAGE_LIMIT)
+    except ValueError: limit = -1
+    if limit < 0: return jsonify({'message': 'limit must be a non-negative integer'}), 400
+
+    def build():
+        ancestor = blockchain.locate([block_hash]); fork = ancestor is None
+        if fork: ancestor = blockchain.locate(locator)
+        if ancestor is None: return jsonify({'fork': True, 'ancestor': None, 'message': 'No common ancestor: none of the given hashes are on this chain.'}), 404
+        blocks = blockchain.get_blocks(ancestor.index + 1, min(ancestor.index + 1 + limit, tip.index + 1))
+        return json_object(fork=fork, ancestor={'index': ancestor.index, 'hash': ancestor.hash}, chain=json_blocks(blocks), count=len(blocks), length=tip.index + 1, more=ancestor.index + len(blocks) < tip.index)
+    return conditional(tip.hash, build)
+
+@app.route('/block/<ref>', methods=['GET'])
+def get_block(ref):
+    """A single block by index or hash. Looked up by hash the response can never change, so it is cacheable forever."""
+    block = blockchain.get_block(ref)
+    if block is None: return jsonify({'message': 'Block not found'}), 404
+    by_hash = ref == block.hash
+    return conditional(block.hash, lambda: Response(blockchain.block_json.get(block), mimetype='application/json'), IMMUTABLE_CACHE_CONTROL if by_hash else 'no-cache')
+
+TRANSACTION_FIELDS = ['sender', 'recipient', 'amount', 'signature', 'timestamp']
+
+def parse_transaction(values):
+    """Builds a signed Transaction from a request payload, or returns None if required fields are missing or malformed."""
+    if not isinstance(values, dict) or not all(k in values for k in TRANSACTION_FIELDS): return None
+    if not all(isinstance(values[k], str) for k in ('sender', 'recipient', 'signature')): return None
+    if len(values['sender']) > MAX_ADDRESS_LENGTH or len(values['recipient']) > MAX_ADDRESS_LENGTH: return None
+    # get_json accepts NaN, Infinity and ints of any length; none of them can take part in float balance arithmetic
+    if any(isinstance(values.get(k), (int, float)) and not isinstance(values[k], bool) and not is_finite_number(values[k]) for k in ('amount', 'fee', 'timestamp')): return None
+    tx_object = Transaction(values['sender'], values['recipient'], values['amount'], timestamp=values['timestamp'], fee=values.get('fee'), sequence=values.get('sequence'))
+    tx_object.set_signature(values['signature'])
+    return tx_object
 
-# REWRITTEN to correctly create the Transaction object
 @app.route('/transactions/new', methods=['POST'])
 def new_transaction():
+    # Only the cheap shape checks happen here; signature, balance and sequence checks run on the admission workers
+    tx_object = parse_transaction(request.get_json())
+    if tx_object is None: return jsonify({'message': 'Missing values in transaction data'}), 400
+    tx_id = admission.submit(tx_object)
+    if tx_id is None: return jsonify({'message': 'Admission queue is full, try again shortly.'}), 503
+    response = {'message': 'Transaction queued for validation.', 'tx_id': tx_id, 'status_url': f'/tx/{tx_id}/status'}
+    return jsonify(response), 202
+
+MAX_BATCH_TRANSACTIONS = 1000
+
+@app.route('/transactions/batch', methods=['POST'])
+def new_transaction_batch():
+    """Accepts a list of signed transactions (or {'transactions': [...]}) and reports a result for each one."""
     values = request.get_json()
-    required = ['sender', 'recipient', 'amount', 'signature', 'timestamp']
-    if not all(k in values for k in required):
-        return jsonify({'message': 'Missing values in transaction data'}), 400
-
-    # Create a proper Transaction object from the received data
-    tx_object = Transaction(
-        sender=values['sender'],
-        recipient=values['recipient'],
-        amount=values['amount'],
-        timestamp=values['timestamp']
-    )
-    tx_object.set_signature(values['signature'])
+    items = values.get('transactions') if isinstance(values, dict) else values
+    if not isinstance(items, list): return jsonify({'message': 'Expected a list of transactions'}), 400
+    if len(items) > MAX_BATCH_TRANSACTIONS: return jsonify({'message': f'At most {MAX_BATCH_TRANSACTIONS} transactions per batch'}), 413
 
-    # The add_transaction method now performs full validation
-    if blockchain.add_transaction(tx_object):
-        response = {'message': 'Transaction is valid and has been added to the pending pool.'}
-        return jsonify(response), 201
-    else:
-        response = {'message': 'Transaction failed validation and was rejected.'}
-        return jsonify(response), 400
+    results, tx_objects, positions = [None] * len(items), [], []
+    for i, item in enumerate(items):
+        tx_object = parse_transaction(item)
+        if tx_object is None:
+            results[i] = {'index': i, 'accepted': False, 'message': 'Missing or malformed values in transaction data'}; continue
+        tx_objects.append(tx_object); positions.append(i)
+
+    for i, tx_object, (accepted, reason) in zip(positions, tx_objects, blockchain.add_transactions(tx_objects)):
+        results[i] = {'index': i, 'accepted': accepted, 'tx_id': tx_object.calculate_id(), 'message': reason or 'Added to the pending pool.'}
+    accepted_count = sum(1 for r in results if r['accepted'])
+    return jsonify({'results': results, 'accepted': accepted_count, 'rejected': len(results) - accepted_count}), 200
 
 @app.route('/transactions/sign', methods=['POST'])
 def sign_transaction_request():
@@ -56,13 +300,31 @@ def sign_transaction_request():
     required = ['private_key', 'sender', 'recipient', 'amount', 'timestamp']
     if not all(k in values for k in required): return jsonify({'message': 'Missing values'}), 400
     try:
-        pk_obj = SigningKey.from_string(bytes.fromhex(values['private_key']), curve=NIST384p)
-        tx = Transaction(values['sender'], values['recipient'], values['amount'], timestamp=values['timestamp'])
+        pk_obj = c3301_crypto.load_signing_key(values['private_key'])
+        tx = Transaction(values['sender'], values['recipient'], values['amount'], timestamp=values['timestamp'], fee=values.get('fee'), sequence=values.get('sequence'))
         signature = pk_obj.sign(tx.to_json().encode())
         return jsonify({'signature': signature.hex()}), 200
     except Exception as e:
         return jsonify({'message': f"Error during signing: {e}"}), 500
 
+@app.route('/transactions/sign/batch', methods=['POST'])
+def sign_transaction_batch():
+    """Signs many transactions with one key. The key is parsed once; each item costs only the ECDSA signature."""
+    values = request.get_json()
+    if not isinstance(values, dict) or 'private_key' not in values or not isinstance(values.get('transactions'), list): return jsonify({'message': 'Missing values'}), 400
+    # Same cap as /transactions/batch, which is where a signed batch goes next
+    if len(values['transactions']) > MAX_BATCH_TRANSACTIONS: return jsonify({'message': f'At most {MAX_BATCH_TRANSACTIONS} transactions per batch'}), 413
+    required = ['recipient', 'amount', 'timestamp']
+    for i, item in enumerate(values['transactions']):
+        if not isinstance(item, dict) or not all(k in item for k in required): return jsonify({'message': f'Missing values in transaction {i}'}), 400
+    try:
+        pk_obj = c3301_crypto.load_signing_key(values['private_key'])
+        default_sender = pk_obj.verifying_key.to_string().hex()
+        signed = [Transaction(item.get('sender', default_sender), item['recipient'], item['amount'], timestamp=item['timestamp'], fee=item.get('fee'), sequence=item.get('sequence')).sign(pk_obj).to_payload() for item in values['transactions']]
+        return jsonify({'transactions': signed, 'count': len(signed)}), 200
+    except Exception as e:
+        return jsonify({'message': f"Error during signing: {e}"}), 500
+
 @app.route('/forge', methods=['POST'])
 def forge_block():
     values = request.get_json()
@@ -70,10 +332,15 @@ def forge_block():
     if not forger_address: return jsonify({'message': 'Error: Forger address is required.'}), 400
     new_block = blockchain.forge_transaction_block(forger_address)
     if new_block:
-        return jsonify({'message': 'Transaction Block Forged!', 'block': vars(new_block)}), 200
+        return json_object(message='Transaction Block Forged!', block=blockchain.block_json.get(new_block))
     else:
         return jsonify({'message': 'Forging failed. No pending transactions.'}), 400
 
+@app.route('/forger', methods=['GET'])
+def get_forger_stats():
+    if auto_forger is None: return jsonify({'enabled': False, 'message': 'Set C3301_FORGER_ADDRESS to enable automatic forging.'}), 200
+    return jsonify(dict(auto_forger.stats(), enabled=True)), 200
+
 @app.route('/mint', methods=['POST'])
 def mint_coin():
     values = request.get_json(); required = ['solver_address', 'secret_phrase']
@@ -81,11 +348,83 @@ def mint_coin():
     class SolverWallet: address = values['solver_address']
     new_block = blockchain.attempt_mint(SolverWallet, values['secret_phrase'])
     if new_block:
-        return jsonify({'message': 'New Artifact Block Forged!', 'block': vars(new_block)}), 200
+        return json_object(message='New Artifact Block Forged!', block=blockchain.block_json.get(new_block))
     return jsonify({'message': 'Minting failed. Invalid solution.'}), 400
 
+# --- Server-Sent Events ---
+SSE_KEEPALIVE_SECONDS = 15
+
+def sse(event, data): return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def status_event():
+    tip = blockchain.latest_block
+    return sse('status', {'tip': dict(tip.header(), transaction_count=len(tip.transactions)), 'mempool': {'count': len(blockchain.mempool), 'bytes': blockchain.mempool.bytes}})
+
+@app.route('/events', methods=['GET'])
+def stream_events():
+    """
+    Pushes 'block', 'mint' and 'mempool' events as they happen, starting with a 'status' event describing the
+    current tip. Readers have no writer to push to them, so their streams poll the store while idle.
+    """
+    if not request.environ.get('wsgi.multithread'):
+        # A stream never ends, so on a sync worker (gunicorn's default) it would hold the whole process until the worker timeout kills it
+        return jsonify({'message': 'Event streams need a threaded or async server; poll /chain instead.'}), 503
+    subscriber = blockchain.events.subscribe()
+    wait = READER_REFRESH_INTERVAL if ROLE == 'reader' else SSE_KEEPALIVE_SECONDS
+    def generate():
+        try:
+            yield status_event()
+            idle_since = time.time()
+            while True:
+                try: event, data = subscriber.get(timeout=wait)
+                except queue.Empty:
+                    if ROLE == 'reader': refresh_reader()
+                    if time.time() - idle_since >= SSE_KEEPALIVE_SECONDS: idle_since = time.time(); yield ": keepalive\n\n"
+                    continue
+                idle_since = time.time(); yield sse(event, data)
+        finally: blockchain.events.unsubscribe(subscriber)
+    return Response(generate(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/stats', methods=['GET'])
+def get_stats(): return jsonify(blockchain.get_stats()), 200
+
 @app.route('/address/<address>', methods=['GET'])
-def get_address_info(address): return jsonify(blockchain.get_address_data(address)), 200
+def get_address_info(address):
+    # The next expected sequence is part of the response and can change with the mempool alone
+    etag = f"{blockchain.latest_block.hash}-{blockchain.expected_sequence(address)}"
+    return conditional(etag, lambda: (jsonify(blockchain.get_address_data(address)), 200))
+
+MAX_BULK_ADDRESSES = 10000
+
+@app.route('/addresses', methods=['POST'])
+def get_addresses_info():
+    """
+    Bulk /address lookup: {"addresses": [...], "transactions": false, "limit": null}. Balances for every address come
+    from one pass over the chain; set "transactions" to include them too, optionally just the latest `limit` per address.
+    """
+    values = request.get_json()
+    addresses = values.get('addresses') if isinstance(values, dict) else None
+    if not isinstance(addresses, list) or not all(isinstance(a, str) for a in addresses): return jsonify({'message': 'Expected {"addresses": [...]} with address strings'}), 400
+    if len(addresses) > MAX_BULK_ADDRESSES: return jsonify({'message': f'At most {MAX_BULK_ADDRESSES} addresses per request'}), 413
+    limit = values.get('limit')
+    if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int) or limit < 0): return jsonify({'message': 'limit must be a non-negative integer'}), 400
+    results = blockchain.get_addresses_data(addresses, include_transactions=bool(values.get('transactions')), max_transactions=limit)
+    return jsonify({'addresses': list(results.values()), 'count': len(results)}), 200
+
+@app.route('/tx/<tx_id>/status', methods=['GET'])
+def get_transaction_status(tx_id):
+    status = admission.status(tx_id)
+    if status is None: return jsonify({'message': 'Unknown transaction id'}), 404
+    return jsonify(status), 200
+
+@app.route('/admission', methods=['GET'])
+def get_admission_stats(): return jsonify(admission.stats()), 200
+
+@app.route('/tx/<tx_id>/proof', methods=['GET'])
+def get_transaction_proof(tx_id):
+    proof = blockchain.get_transaction_proof(tx_id)
+    if proof is None: return jsonify({'message': 'Transaction not found in any Merkle-committed block.'}), 404
+    return jsonify(proof), 200
 
 # --- Main execution ---
 if __name__ == '__main__':
@@ -0,0 +1,141 @@
+"""
+Async serving mode. Serves the same routes as app.py from an ASGI server, so idle and slow connections
+cost a coroutine rather than a worker thread:
+
+    pip install uvicorn
+    uvicorn asgi:app --port 5000        (or: python asgi.py -p 5000)
+
+GET /events is handled natively: each stream is a coroutine waiting on the EventHub, so one process can
+hold thousands of them open. Every other route runs the Flask app unchanged on a bounded thread pool,
+which keeps CPU-bound work (ECDSA, hashing, key generation) off the event loop.
+"""
+import asyncio
+import io
+import json
+import os
+import sys
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+import app as flask_module
+
+WSGI_THREADS = int(os.getenv('C3301_ASGI_THREADS', 32))
+executor = ThreadPoolExecutor(max_workers=WSGI_THREADS, thread_name_prefix='wsgi')
+
+class AsyncSubscriber:
+    """
+    EventHub subscriber for an event loop. publish() runs on whichever thread forged the block, so items
+    are handed to the loop with call_soon_threadsafe; the oldest is dropped if the client falls behind.
+    """
+    def __init__(self, loop, max_queue):
+        self.loop, self.queue = loop, asyncio.Queue(maxsize=max_queue)
+    def put_nowait(self, item): self.loop.call_soon_threadsafe(self._put, item)
+    def _put(self, item):
+        if self.queue.full(): self.queue.get_nowait()
+        self.queue.put_nowait(item)
+
+def client_address(scope):
+    """The client IP, honouring C3301_TRUSTED_PROXIES the way ProxyFix does for the Flask routes."""
+    if flask_module.TRUSTED_PROXIES:
+        forwarded = [value.decode('latin1') for name, value in scope['headers'] if name == b'x-forwarded-for']
+        hops = [hop.strip() for hop in ','.join(forwarded).split(',') if hop.strip()]
+        if len(hops) >= flask_module.TRUSTED_PROXIES: return hops[-flask_module.TRUSTED_PROXIES]
+    return scope['client'][0] if scope.get('client') else None
+
+async def send_json(send, status, body, headers=()):
+    await send({'type': 'http.response.start', 'status': status, 'headers': [(b'content-type', b'application/json')] + list(headers)})
+    await send({'type': 'http.response.body', 'body': json.dumps(body).encode()})
+
+async def stream_events(scope, receive, send):
+    """The coroutine version of app.stream_events: same events, same keepalives, no thread held while idle."""
+    wait = flask_module.rate_limiter.check('stream_events', client_address(scope))
+    if wait: return await send_json(send, 429, {'message': 'Too many requests, slow down.', 'retry_after': round(wait, 3)}, [(b'retry-after', flask_module.RateLimiter.retry_after_header(wait).encode())])
+    hub, loop = flask_module.blockchain.events, asyncio.get_running_loop()
+    subscriber = hub.subscribe(AsyncSubscriber(loop, hub.max_queue))
+    wait = flask_module.READER_REFRESH_INTERVAL if flask_module.ROLE == 'reader' else flask_module.SSE_KEEPALIVE_SECONDS
+    disconnected = asyncio.ensure_future(wait_for_disconnect(receive))
+    try:
+        await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-type', b'text/event-stream; charset=utf-8'), (b'cache-control', b'no-cache'), (b'x-accel-buffering', b'no')]})
+        await send({'type': 'http.response.body', 'body': flask_module.status_event().encode(), 'more_body': True})
+        idle_since = time.time()
+        while not disconnected.done():
+            next_event = asyncio.ensure_future(subscriber.queue.get())
+            done, _ = await asyncio.wait({next_event, disconnected}, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+            if next_event not in done:
+                next_event.cancel()
+                if flask_module.ROLE == 'reader': await loop.run_in_executor(executor, flask_module.refresh_reader)
+                if time.time() - idle_since >= flask_module.SSE_KEEPALIVE_SECONDS:
+                    idle_since = time.time(); await send({'type': 'http.response.body', 'body': b": keepalive\n\n", 'more_body': True})
+                continue
+            event, data = next_event.result(); idle_since = time.time()
+            await send({'type': 'http.response.body', 'body': flask_module.sse(event, data).encode(), 'more_body': True})
+    finally:
+        hub.unsubscribe(subscriber); disconnected.cancel()
+
+async def wait_for_disconnect(receive):
+    while (await receive())['type'] != 'http.disconnect': pass
+
+# --- WSGI bridge ---
+# asgiref's WsgiToAsgi runs every request on one shared thread; this runs them on the pool instead.
+def wsgi_environ(scope, body):
+    server, client = scope.get('server') or ('localhost', 80), scope.get('client')
+    environ = {
+        'REQUEST_METHOD': scope['method'], 'SCRIPT_NAME': scope.get('root_path', '').encode('utf8').decode('latin1'),
+        'PATH_INFO': scope['path'].encode('utf8').decode('latin1'), 'QUERY_STRING': scope['query_string'].decode('latin1'),
+        'SERVER_NAME': server[0], 'SERVER_PORT': str(server[1]), 'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0] if client else '', 'REMOTE_PORT': str(client[1]) if client else '',
+        'wsgi.version': (1, 0), 'wsgi.url_scheme': scope.get('scheme', 'http'), 'wsgi.input': io.BytesIO(body), 'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True, 'wsgi.multiprocess': True, 'wsgi.run_once': False,
+    }
+    for name, value in scope['headers']:
+        key = name.decode('latin1').upper().replace('-', '_'); value = value.decode('latin1')
+        if key not in ('CONTENT_TYPE', 'CONTENT_LENGTH'): key = 'HTTP_' + key
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+def start_wsgi(environ):
+    """Runs the Flask app up to its first body chunk (on a pool thread) and returns (status, headers, first chunk, iterable, iterator)."""
+    started = {}
+    def start_response(status, headers, exc_info=None): started['status'], started['headers'] = status, headers
+    result = flask_module.app(environ, start_response)
+    iterator = iter(result)
+    first = next(iterator, None)
+    return started['status'], started['headers'], first, result, iterator
+
+async def call_flask(scope, receive, send):
+    body, more = [], True
+    while more:
+        message = await receive()
+        if message['type'] == 'http.disconnect': return
+        body.append(message.get('body', b'')); more = message.get('more_body', False)
+    loop = asyncio.get_running_loop()
+    status, headers, chunk, result, iterator = await loop.run_in_executor(executor, start_wsgi, wsgi_environ(scope, b''.join(body)))
+    try:
+        await send({'type': 'http.response.start', 'status': int(status.split(' ', 1)[0]), 'headers': [(k.lower().encode('latin1'), v.encode('latin1')) for k, v in headers]})
+        while chunk is not None:
+            if chunk: await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+            chunk = await loop.run_in_executor(executor, next, iterator, None)
+        await send({'type': 'http.response.body', 'body': b''})
+    finally:
+        if hasattr(result, 'close'): await loop.run_in_executor(executor, result.close)
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup': await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown': executor.shutdown(wait=False); await send({'type': 'lifespan.shutdown.complete'}); return
+
+# Routes with a native coroutine handler; everything else goes through the Flask app
+NATIVE_ROUTES = {('GET', '/events'): stream_events}
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan': return await lifespan(receive, send)
+    if scope['type'] != 'http': return
+    handler = NATIVE_ROUTES.get((scope['method'], scope['path']), call_flask)
+    await handler(scope, receive, send)
+
+if __name__ == '__main__':
+    parser = ArgumentParser(); parser.add_argument('-p', '--port', default=5000, type=int, help='port to listen on'); args = parser.parse_args()
+    try: import uvicorn
+    except ImportError: sys.exit("The async mode needs an ASGI server: pip install uvicorn")
+    uvicorn.run(app, host='0.0.0.0', port=args.port)
@@ -0,0 +1,50 @@
+"""
+Build step for the frontend assets. Copies every file in static/ to static/dist/ under a content-hashed
+name (style.css -> style.3f9a1c2b7e.css), writes a gzip-compressed copy next to it when that is
+meaningfully smaller, and records the mapping in static/dist/manifest.json for the templates.
+
+Hashed names change whenever the content does, so app.py serves them with year-long immutable
+cache headers. Re-run after editing anything in static/ and restart the app:
+
+    python build_static.py
+"""
+import gzip
+import hashlib
+import json
+import os
+import shutil
+from argparse import ArgumentParser
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, 'static')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+MANIFEST_NAME = 'manifest.json'
+MIN_GZIP_SAVING = 0.1  # keep a .gz only if it is at least 10% smaller (PNGs, for instance, are already compressed)
+
+def hashed_name(name, content):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:10]}{ext}"
+
+def build(static_dir=STATIC_DIR, dist_dir=DIST_DIR):
+    """Rebuilds dist_dir from scratch and returns the manifest {source name: hashed name}."""
+    if os.path.isdir(dist_dir): shutil.rmtree(dist_dir)
+    os.makedirs(dist_dir)
+    manifest = {}
+    for name in sorted(os.listdir(static_dir)):
+        path = os.path.join(static_dir, name)
+        if not os.path.isfile(path): continue
+        with open(path, 'rb') as f: content = f.read()
+        output = hashed_name(name, content); manifest[name] = output
+        with open(os.path.join(dist_dir, output), 'wb') as f: f.write(content)
+        compressed = gzip.compress(content, compresslevel=9, mtime=0)
+        keep_gzip = len(compressed) <= len(content) * (1 - MIN_GZIP_SAVING)
+        if keep_gzip:
+            with open(os.path.join(dist_dir, output + '.gz'), 'wb') as f: f.write(compressed)
+        print(f"{name:<24} -> {output:<32} {len(content):>8} bytes" + (f", {len(compressed):>8} gzipped" if keep_gzip else ""))
+    with open(os.path.join(dist_dir, MANIFEST_NAME), 'w') as f: json.dump(manifest, f, indent=4, sort_keys=True)
+    return manifest
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Build content-hashed, precompressed copies of the static assets.'); parser.parse_args()
+    manifest = build()
+    print(f"Wrote {len(manifest)} assets and {MANIFEST_NAME} to {DIST_DIR}.")
@@ -0,0 +1,61 @@
+"""
+Offline bulk signer for payout jobs.
+
+Reads a JSON list of transfers ({"recipient": ..., "amount": ..., optional "timestamp", "fee" and "sequence"})
+and writes a JSON list of signed payloads that can be POSTed to /transactions/new as-is.
+The private key never leaves this machine and is parsed once per worker process.
+
+    python bulk_sign.py --key-file payout.key payouts.json -o signed.json
+"""
+import json
+import sys
+import time
+from argparse import ArgumentParser
+from multiprocessing import Pool, cpu_count
+import c3301_crypto
+from c3301_blockchain import Transaction
+
+# Set once per worker by _init_worker so the key is not re-parsed for every transaction
+_signing_key = None
+_sender = None
+
+def _init_worker(private_key_hex):
+    global _signing_key, _sender
+    _signing_key = c3301_crypto.load_signing_key(private_key_hex)
+    _sender = _signing_key.verifying_key.to_string().hex()
+
+def _sign_one(item):
+    tx = Transaction(_sender, item['recipient'], item['amount'], timestamp=item.get('timestamp') or time.time(), fee=item.get('fee'), sequence=item.get('sequence'))
+    return tx.sign(_signing_key).to_payload()
+
+def sign_file(private_key_hex, transfers, workers=None):
+    """Signs every transfer, spreading the ECDSA work over `workers` processes (defaults to all cores)."""
+    workers = workers or cpu_count()
+    if workers == 1 or len(transfers) < 2:
+        _init_worker(private_key_hex)
+        return [_sign_one(item) for item in transfers]
+    chunksize = max(1, len(transfers) // (workers * 4))
+    with Pool(workers, initializer=_init_worker, initargs=(private_key_hex,)) as pool:
+        return pool.map(_sign_one, transfers, chunksize=chunksize)
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Sign a file of C3301 transfers offline.')
+    parser.add_argument('input', help='JSON file containing a list of {"recipient", "amount", "timestamp"} objects')
+    parser.add_argument('-k', '--key-file', required=True, help='file holding the hex-encoded private key')
+    parser.add_argument('-o', '--output', help='where to write the signed payloads (defaults to stdout)')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='number of signing processes')
+    args = parser.parse_args()
+
+    with open(args.key_file, 'r') as f: private_key_hex = f.read().strip()
+    with open(args.input, 'r') as f: transfers = json.load(f)
+    missing = [i for i, item in enumerate(transfers) if 'recipient' not in item or 'amount' not in item]
+    if missing: sys.exit(f"Transfers {missing} are missing 'recipient' or 'amount'.")
+
+    started = time.time()
+    signed = sign_file(private_key_hex, transfers, args.workers)
+    elapsed = time.time() - started
+    if args.output:
+        with open(args.output, 'w') as f: json.dump(signed, f, indent=4)
+    else:
+        json.dump(signed, sys.stdout, indent=4); print()
+    print(f"Signed {len(signed)} transactions in {elapsed:.2f}s.", file=sys.stderr)
@@ -0,0 +1,87 @@
+import queue
+import threading
+from collections import OrderedDict
+
+class AdmissionQueue:
+    """
+    Moves transaction validation off the request thread. Handlers submit() a parsed Transaction and
+    reply straight away; worker threads drain the queue in batches through Blockchain.add_transactions,
+    so each batch gets the shared (parallel) signature checks. Outcomes are kept in a bounded LRU for
+    the status endpoint.
+    """
+    def __init__(self, blockchain, workers=1, max_queue=10000, batch_size=64, status_capacity=100000):
+        self.blockchain, self.batch_size, self.status_capacity = blockchain, batch_size, status_capacity
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._statuses = OrderedDict()  # tx_id -> (state, message)
+        self._queued = {}  # tx_id -> signatures of the copies still waiting for a worker
+        self._lock = threading.Lock()
+        self._workers = [threading.Thread(target=self._run, name=f"admission-{i}", daemon=True) for i in range(workers)]
+
+    def start(self):
+        for worker in self._workers:
+            if not worker.is_alive(): worker.start()
+        return self
+
+    def _set_status(self, tx_id, state, message=None):
+        with self._lock:
+            self._statuses[tx_id] = (state, message); self._statuses.move_to_end(tx_id)
+            while len(self._statuses) > self.status_capacity: self._statuses.popitem(last=False)
+
+    def submit(self, transaction):
+        """
+        Queues a transaction for validation. Returns its id, or None if the queue is full. Only byte-identical
+        resubmissions are skipped: the id leaves the signature out, so a copy with a bad signature must not
+        shadow a valid one.
+        """
+        tx_id = transaction.calculate_id()
+        with self._lock:
+            signatures = self._queued.setdefault(tx_id, set())
+            if transaction.signature in signatures: return tx_id
+            signatures.add(transaction.signature); previous = self._statuses.get(tx_id)
+        # Marked queued before it is enqueued, so a worker that finishes first can't have its verdict overwritten
+        self._set_status(tx_id, 'queued')
+        try: self._queue.put_nowait((tx_id, transaction))
+        except queue.Full:
+            if not self._dequeued(tx_id, transaction.signature):
+                with self._lock:
+                    if previous is None: self._statuses.pop(tx_id, None)
+                    else: self._statuses[tx_id] = previous
+            return None
+        return tx_id
+
+    def _dequeued(self, tx_id, signature):
+        """Forgets one queued copy; returns True if other copies of the same id are still waiting."""
+        with self._lock:
+            signatures = self._queued.get(tx_id, set()); signatures.discard(signature)
+            if signatures: return True
+            self._queued.pop(tx_id, None); return False
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try: batch.append(self._queue.get_nowait())
+                except queue.Empty: break
+            try:
+                results = self.blockchain.add_transactions([transaction for _, transaction in batch])
+            except Exception as e:
+                print(f"Admission worker: batch failed: {e}")
+                results = [(False, f"Internal error during validation: {e}")] * len(batch)
+            for (tx_id, transaction), (accepted, reason) in zip(batch, results):
+                # A rejected copy doesn't decide the id's status while another copy is still waiting
+                if self._dequeued(tx_id, transaction.signature) and not accepted: continue
+                self._set_status(tx_id, 'accepted' if accepted else 'rejected', reason)
+
+    def status(self, tx_id):
+        """queued / accepted / rejected / confirmed, or 'dropped' if it was accepted but left the mempool unconfirmed."""
+        with self.blockchain.lock.read():
+            block, position = self.blockchain.find_transaction(tx_id)
+            pending = tx_id in self.blockchain.mempool
+        if block is not None: return {'tx_id': tx_id, 'status': 'confirmed', 'block_index': block.index, 'position': position}
+        with self._lock: state, message = self._statuses.get(tx_id, (None, None))
+        if pending: state, message = 'accepted', None
+        elif state == 'accepted': state, message = 'dropped', 'Evicted or expired from the mempool before being forged.'
+        if state is None: return None
+        return {'tx_id': tx_id, 'status': state, 'message': message}
+
+    def stats(self): return {'queued': self._queue.qsize(), 'workers': len(self._workers), 'tracked': len(self._statuses)}
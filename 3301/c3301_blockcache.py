@@ -0,0 +1,39 @@
+import json
+import threading
+from collections import OrderedDict
+
+def encode_block(block):
+    """The canonical JSON encoding of a block: what jsonify(vars(block)) sends, as bytes."""
+    return json.dumps(vars(block), sort_keys=True, separators=(",", ":")).encode()
+
+class BlockJSONCache:
+    """
+    Serialised JSON for recently used blocks, keyed by block hash. Blocks never change once appended, so
+    each is encoded once (when appended, or on first request for older ones) and responses are assembled
+    from the cached bytes. Bounded by total size, evicting the least recently used blocks.
+    """
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # block hash -> bytes
+        self.bytes = 0
+        self._lock = threading.Lock()
+        self.hits, self.misses = 0, 0
+
+    def __len__(self): return len(self._entries)
+
+    def get(self, block):
+        with self._lock:
+            encoded = self._entries.get(block.hash)
+            if encoded is not None: self._entries.move_to_end(block.hash); self.hits += 1; return encoded
+            self.misses += 1
+        return self.put(block)
+
+    def put(self, block):
+        encoded = encode_block(block)
+        with self._lock:
+            if block.hash not in self._entries:
+                self._entries[block.hash] = encoded; self.bytes += len(encoded)
+                while self.bytes > self.max_bytes and len(self._entries) > 1: self.bytes -= len(self._entries.popitem(last=False)[1])
+        return encoded
+
+    def stats(self): return {'blocks': len(self._entries), 'bytes': self.bytes, 'max_bytes': self.max_bytes, 'hits': self.hits, 'misses': self.misses}
@@ -1,8 +1,17 @@
 import hashlib
 import time
 import json
+import math
 import os
-from ecdsa import SigningKey, VerifyingKey, NIST384p
+import threading
+from collections import deque
+import c3301_crypto
+from c3301_blockcache import BlockJSONCache
+from c3301_events import EventHub
+from c3301_mempool import Mempool, MempoolJournal
+from c3301_rwlock import ReadWriteLock, reads, writes
+from c3301_stats import ChainStats, SYSTEM_SENDERS
+from c3301_store import AddressTable, BlockStore
 
 class PuzzleMaster:
     # ... (The PuzzleMaster class is correct and does not need changes)
@@ -33,83 +42,394 @@ class PuzzleMaster:
         elif difficulty_level <= 3301: return self._create_hashing_challenge_puzzle(seed, difficulty_level)
         else: return {"puzzle": "All tokens have been discovered.", "clue": "The hunt is complete."}
 
+# Addresses are raw NIST384p public keys in hex; nothing longer can ever sign or be signed for
+MAX_ADDRESS_LENGTH = 192
+
+def is_finite_number(value):
+    """True for an int or float with a finite float value. Bools, NaN, infinities and ints too large for a float are not."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)): return False
+    try: return math.isfinite(value)
+    except OverflowError: return False
+
 class Wallet:
-    def __init__(self): self.private_key = SigningKey.generate(curve=NIST384p); self.public_key = self.private_key.verifying_key; self.address = self.public_key.to_string().hex()
+    def __init__(self, private_key=None): self.private_key = private_key or c3301_crypto.generate_signing_key(); self.public_key = self.private_key.verifying_key; self.address = self.public_key.to_string().hex()
 
 class Transaction:
-    def __init__(self, sender, recipient, amount, timestamp=None, data=None): self.sender, self.recipient, self.amount, self.timestamp, self.signature, self.data = sender, recipient, amount, timestamp or time.time(), None, data or {}
-    def to_json(self): return json.dumps({"sender": self.sender, "recipient": self.recipient, "amount": self.amount, "timestamp": self.timestamp, "data": self.data}, sort_keys=True)
+    def __init__(self, sender, recipient, amount, timestamp=None, data=None, fee=None, sequence=None): self.sender, self.recipient, self.amount, self.timestamp, self.signature, self.data, self.fee, self.sequence = sender, recipient, amount, timestamp or time.time(), None, data or {}, fee, sequence
+    def to_json(self):
+        payload = {"sender": self.sender, "recipient": self.recipient, "amount": self.amount, "timestamp": self.timestamp, "data": self.data}
+        # Optional fields are only signed when set, so older transactions keep their ids and signatures
+        if self.fee is not None: payload["fee"] = self.fee
+        if self.sequence is not None: payload["sequence"] = self.sequence
+        return json.dumps(payload, sort_keys=True)
+    def to_dict(self):
+        """The form stored in Block.transactions."""
+        tx_data = {"sender": self.sender, "recipient": self.recipient, "amount": self.amount, "timestamp": self.timestamp, "signature": self.signature, "data": self.data}
+        if self.fee is not None: tx_data["fee"] = self.fee
+        if self.sequence is not None: tx_data["sequence"] = self.sequence
+        return tx_data
+    def size(self): return len(json.dumps(self.to_dict(), sort_keys=True))
     def set_signature(self, signature): self.signature = signature
+    def sign(self, signing_key): self.set_signature(signing_key.sign(self.to_json().encode()).hex()); return self
+    def to_payload(self):
+        """The request body /transactions/new expects for this (signed) transaction."""
+        payload = {"sender": self.sender, "recipient": self.recipient, "amount": self.amount, "timestamp": self.timestamp, "signature": self.signature}
+        if self.fee is not None: payload["fee"] = self.fee
+        if self.sequence is not None: payload["sequence"] = self.sequence
+        return payload
+    def calculate_id(self):
+        """The transaction id is the hash of the signed payload, so it does not depend on the signature bytes."""
+        return hashlib.sha256(self.to_json().encode()).hexdigest()
+    @classmethod
+    def from_dict(cls, tx_data):
+        """Rebuilds a Transaction from the dict form stored in Block.transactions."""
+        tx = cls(tx_data.get('sender'), tx_data.get('recipient'), tx_data.get('amount'), timestamp=tx_data.get('timestamp'), data=tx_data.get('data'), fee=tx_data.get('fee'), sequence=tx_data.get('sequence'))
+        tx.set_signature(tx_data.get('signature'))
+        return tx
     @staticmethod
     def is_valid(transaction):
-        if transaction.sender in ["MINT_REWARD", "NETWORK_FEES"]: return True
+        if transaction.sender in SYSTEM_SENDERS: return True
         if not transaction.signature: return False
         try:
-            pk_bytes = bytes.fromhex(transaction.sender); verifying_key = VerifyingKey.from_string(pk_bytes, curve=NIST384p); sig_bytes = bytes.fromhex(transaction.signature)
-            return verifying_key.verify(sig_bytes, transaction.to_json().encode())
+            return c3301_crypto.verify(transaction.sender, transaction.signature, transaction.to_json().encode())
         except Exception as e: print(f"Transaction validation failed: {e}"); return False
+    @staticmethod
+    def are_valid(transactions):
+        """Batch form of is_valid. Large batches have their signatures checked across worker processes."""
+        needs_check = [tx for tx in transactions if tx.sender not in SYSTEM_SENDERS and tx.signature]
+        verdicts = c3301_crypto.verify_many([(tx.sender, tx.signature, tx.to_json().encode()) for tx in needs_check])
+        checked = {id(tx): valid for tx, valid in zip(needs_check, verdicts)}
+        return [tx.sender in SYSTEM_SENDERS or checked.get(id(tx), False) for tx in transactions]
+
+# --- Merkle Tree Helpers ---
+# Leaves are hex digests (see Block.merkle_leaves); each parent is sha256(left || right) over the raw digest bytes.
+# Up to version 3 an odd node at any level is paired with itself, which lets a block repeat its trailing
+# transactions without changing the root (CVE-2012-2459). From version 4 the odd node is promoted unchanged.
+EMPTY_MERKLE_ROOT = "0" * 64
+
+def _merkle_parent(left, right): return hashlib.sha256(bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+def _merkle_level(level, duplicate_odd):
+    """The level above `level`."""
+    parents = [_merkle_parent(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2: parents.append(_merkle_parent(level[-1], level[-1]) if duplicate_odd else level[-1])
+    return parents
+
+def merkle_root(leaves, duplicate_odd=False):
+    """Computes the Merkle root of a list of hex leaf digests."""
+    if not leaves: return EMPTY_MERKLE_ROOT
+    level = list(leaves)
+    while len(level) > 1: level = _merkle_level(level, duplicate_odd)
+    return level[0]
+
+def merkle_proof(leaves, position, duplicate_odd=False):
+    """Returns the authentication path for the leaf at `position`, from the leaf up to the root. A promoted node has no step at that level."""
+    proof, level = [], list(leaves)
+    while len(level) > 1:
+        sibling = position ^ 1
+        if sibling < len(level): proof.append({"hash": level[sibling], "side": "left" if sibling < position else "right"})
+        elif duplicate_odd: proof.append({"hash": level[position], "side": "right"})
+        level = _merkle_level(level, duplicate_odd)
+        position //= 2
+    return proof
+
+def verify_merkle_proof(leaf, proof, root):
+    """Folds an authentication path from merkle_proof back up and compares it with the expected root."""
+    current = leaf
+    for step in proof: current = _merkle_parent(step["hash"], current) if step["side"] == "left" else _merkle_parent(current, step["hash"])
+    return current == root
+
+def transaction_leaf(tx_data):
+    """The Merkle leaf of a stored transaction dict: a hash of all of it, signature included."""
+    return hashlib.sha256(json.dumps(tx_data, sort_keys=True).encode()).hexdigest()
+
+# Version 1 blocks hash the JSON-dumped transaction list; later versions commit to a Merkle root instead.
+# Version 2 leaves are transaction ids, which leave the signatures out; version 3 leaves cover them too.
+# Version 4 promotes odd Merkle nodes instead of pairing them with themselves.
+LEGACY_BLOCK_VERSION = 1
+MERKLE_BLOCK_VERSION = 2
+SIGNED_LEAF_BLOCK_VERSION = 3
+BLOCK_VERSION = 4
 
 class Block:
-    def __init__(self, index, transactions, timestamp, previous_hash, data=None, nonce=0): self.index, self.transactions, self.timestamp, self.previous_hash, self.data, self.nonce, self.hash = index, transactions, timestamp, previous_hash, data, nonce, self.calculate_hash()
-    def calculate_hash(self): return hashlib.sha256((str(self.index) + json.dumps(self.transactions, sort_keys=True) + str(self.timestamp) + str(self.previous_hash) + json.dumps(self.data, sort_keys=True) + str(self.nonce)).encode()).hexdigest()
+    def __init__(self, index, transactions, timestamp, previous_hash, data=None, nonce=0, version=LEGACY_BLOCK_VERSION, merkle_root=None, hash=None):
+        self.index, self.transactions, self.timestamp, self.previous_hash, self.data, self.nonce, self.version = index, transactions, timestamp, previous_hash, data, nonce, version
+        # merkle_root and hash are always recomputed; stored values are checked against them by Blockchain.is_chain_valid
+        self.merkle_root = self.calculate_merkle_root(); self.hash = self.calculate_hash()
+    def transaction_ids(self): return [Transaction.from_dict(tx).calculate_id() for tx in self.transactions]
+    def transaction_id(self, position): return Transaction.from_dict(self.transactions[position]).calculate_id()
+    def merkle_leaves(self): return [transaction_leaf(tx) for tx in self.transactions] if self.version >= SIGNED_LEAF_BLOCK_VERSION else self.transaction_ids()
+    @property
+    def duplicates_odd_merkle_nodes(self): return self.version < BLOCK_VERSION
+    def calculate_merkle_root(self): return merkle_root(self.merkle_leaves(), self.duplicates_odd_merkle_nodes) if self.version >= MERKLE_BLOCK_VERSION else None
+    def calculate_hash(self):
+        if self.version >= MERKLE_BLOCK_VERSION: return hashlib.sha256((str(self.version) + str(self.index) + self.merkle_root + str(self.timestamp) + str(self.previous_hash) + json.dumps(self.data, sort_keys=True) + str(self.nonce)).encode()).hexdigest()
+        return hashlib.sha256((str(self.index) + json.dumps(self.transactions, sort_keys=True) + str(self.timestamp) + str(self.previous_hash) + json.dumps(self.data, sort_keys=True) + str(self.nonce)).encode()).hexdigest()
+    def header(self):
+        """Everything needed to recompute a Merkle-committed block hash, without the transaction list."""
+        return {k: v for k, v in vars(self).items() if k != 'transactions'}
+
+class TransactionIndex:
+    """
+    Locates confirmed transactions by id. Keys are the first 64 bits of the id as an int, a fraction of the
+    memory of the hex string, and values are the block index and position packed into one int. Callers
+    confirm a hit by hashing the single transaction at that position, so a lookup costs one hash and a
+    prefix collision can only cost another, never a wrong answer.
+    """
+    POSITION_BITS = 32
+    def __init__(self): self._locations = {}
+    def __len__(self): return len(self._locations)
+    def add_block(self, block):
+        for position, tx_id in enumerate(block.transaction_ids()):
+            key = int(tx_id[:16], 16); existing = self._locations.get(key); location = (block.index << self.POSITION_BITS) | position
+            self._locations[key] = location if existing is None else (existing if isinstance(existing, tuple) else (existing,)) + (location,)
+    def candidates(self, tx_id):
+        """(block index, position) pairs whose transaction id shares the first 64 bits of `tx_id`."""
+        try: found = self._locations.get(int(tx_id[:16], 16))
+        except ValueError: return []
+        locations = () if found is None else found if isinstance(found, tuple) else (found,)
+        return [(location >> self.POSITION_BITS, location & ((1 << self.POSITION_BITS) - 1)) for location in locations]
 
 class Blockchain:
-    def __init__(self):
-        self.chain = []; self.pending_transactions = []; self.nodes = set(); self.chain_file = "blockchain_data.json"; self.puzzle_master = PuzzleMaster(); self.transaction_fee = 0.001; self.load_chain_from_disk()
+    """
+    Chain state shared by every request thread. Queries run in parallel under `lock` as readers; anything that
+    changes the chain, the ledger or the mempool (admission, forging, minting) goes through it as the single writer.
+
+    With read_only=True the instance follows a chain owned by a writer process instead: it never writes the
+    block store or the mempool journal, and refresh() picks up whatever the writer has appended since.
+    """
+    def __init__(self, read_only=False):
+        self.read_only = read_only
+        self.lock = ReadWriteLock(); self.chain = []; self.mempool_file = "mempool_journal.jsonl"; self.mempool = Mempool(journal=None if read_only else MempoolJournal(self.mempool_file)); self.max_block_transactions = 500; self.max_block_bytes = 250_000; self.nodes = set(); self.chain_file = "blockchain_data.db"; self.legacy_chain_file = "blockchain_data.json"; self.puzzle_master = PuzzleMaster(); self.transaction_fee = 0.001
+        self.addresses = AddressTable(); self.store = BlockStore(self.chain_file, self.addresses)
+        self.tx_index = TransactionIndex(); self.confirmation_latencies = deque(maxlen=1000); self.events = EventHub(); self.block_json = BlockJSONCache()
+        if read_only: self.mempool_follower = MempoolJournal(self.mempool_file); self.refresh_lock = threading.Lock(); self.rebuild_indexes(); self.wait_for_writer(); self.refresh(); return
+        self.load_chain_from_disk(); self.rebuild_indexes(); self.restore_mempool()
     def save_chain_to_disk(self):
+        """Appends any blocks the store doesn't have yet; existing blocks are never rewritten."""
         try:
-            chain_data = [vars(block) for block in self.chain]
-            with open(self.chain_file, 'w') as f: json.dump(chain_data, f, indent=4)
+            unsaved = self.chain[self.store.height():]
+            for block in unsaved:
+                for tx_data in block.transactions: tx_data['sender'] = self.addresses.intern(tx_data.get('sender')); tx_data['recipient'] = self.addresses.intern(tx_data.get('recipient'))
+            self.store.append_blocks(unsaved)
         except Exception as e: print(f"Error saving chain to disk: {e}")
     def load_chain_from_disk(self):
-        if not os.path.exists(self.chain_file): self.create_genesis_block(); self.save_chain_to_disk(); return
         try:
-            with open(self.chain_file, 'r') as f: self.chain = [Block(**block_data) for block_data in json.load(f)]
-        except Exception: self.create_genesis_block(); self.save_chain_to_disk()
+            stored_blocks = list(self.store.load_blocks())
+            if not stored_blocks and os.path.exists(self.legacy_chain_file):
+                # One-off migration from the old JSON chain file; it is left in place untouched
+                print(f"Migrating {self.legacy_chain_file} into {self.chain_file}...")
+                with open(self.legacy_chain_file, 'r') as f: stored_blocks = json.load(f)
+            if not stored_blocks: self.create_genesis_block(); self.save_chain_to_disk(); return
+            self.chain = [Block(**block_data) for block_data in stored_blocks]
+            if not self.is_chain_valid(stored_blocks): raise ValueError("stored chain failed validation")
+            self.save_chain_to_disk()
+        except Exception as e: print(f"Error loading chain from disk: {e}"); self.store.clear(); self.create_genesis_block(); self.save_chain_to_disk()
+    def is_chain_valid(self, stored_blocks):
+        """
+        Checks stored hashes, Merkle roots and links. Blocks without a 'version' key are legacy version 1 blocks.
+        A transaction id may appear only once per block: before version 4, repeating trailing transactions leaves the Merkle root unchanged.
+        """
+        for i, (block, block_data) in enumerate(zip(self.chain, stored_blocks)):
+            if block_data.get('hash', block.hash) != block.hash or block_data.get('merkle_root') != block.merkle_root: return False
+            if block.version >= MERKLE_BLOCK_VERSION and len(set(block.transaction_ids())) != len(block.transactions): return False
+            if i > 0 and block.previous_hash != self.chain[i - 1].hash: return False
+        return True
     def create_genesis_block(self):
         genesis_seed = hashlib.sha256("The Hunt Begins 2025-06-24".encode()).hexdigest()
         first_puzzle = self.puzzle_master.create_new_puzzle(difficulty_level=1, seed=genesis_seed)
-        self.chain = [Block(index=0, transactions=[], timestamp=time.time(), previous_hash="0", data=first_puzzle)]
+        self.chain = [Block(index=0, transactions=[], timestamp=time.time(), previous_hash="0", data=first_puzzle, version=BLOCK_VERSION)]
+    def restore_mempool(self):
+        """
+        Reloads pending transactions from the mempool journal. Signatures and balances were checked when they
+        were admitted, so each record costs O(1): only transactions confirmed in the meantime are dropped.
+        """
+        journal, self.mempool.journal = self.mempool.journal, None
+        try:
+            for record in journal.replay():
+                tx = Transaction.from_dict(record['tx']); tx_id = tx.calculate_id()
+                if not record.get('verified') or tx_id != record['id'] or self.is_confirmed(tx_id): continue
+                self.mempool.add(tx_id, tx, record['fee'], record['size'], arrival=record['arrival'])
+            if len(self.mempool): print(f"Restored {len(self.mempool)} pending transactions from {self.mempool_file}.")
+        except Exception as e: print(f"Error restoring mempool: {e}")
+        finally:
+            self.mempool.journal = journal; journal.rewrite(self.mempool.entries.values())
+    def wait_for_writer(self, poll_interval=1.0):
+        if self.store.height(): return
+        print(f"Waiting for a writer process to create the chain in {self.chain_file}...")
+        while not self.store.height(): time.sleep(poll_interval)
+    def refresh(self):
+        """
+        Read-only mode: catches up with blocks and mempool changes the writer has made. Returns the number of new blocks.
+        Calls are serialized by refresh_lock: follow() advances a file offset, so two concurrent calls would skip journal records.
+        """
+        with self.refresh_lock:
+            height = self.store.height()
+            reset, records = self.mempool_follower.follow()
+            if height <= len(self.chain) and not reset and not records: return 0
+            with self.lock.write():
+                self.store.sync_addresses()
+                new_blocks = [Block(**block_data) for block_data in self.store.load_blocks(start=len(self.chain), end=height)]
+                for block in new_blocks: self.chain.append(block); self._index_block(block); self._announce_block(block)
+                if reset: self.mempool = Mempool(self.mempool.max_count, self.mempool.max_bytes, self.mempool.ttl)
+                for record in records:
+                    if record.get('op') == 'add' and not self.is_confirmed(record['id']):
+                        self.mempool.add(record['id'], Transaction.from_dict(record['tx']), record['fee'], record['size'], arrival=record['arrival'])
+                    elif record.get('op') == 'remove': self.mempool.remove(record['ids'])
+                if reset or records: self._announce_mempool()
+            return len(new_blocks)
+    def rebuild_indexes(self):
+        self.tx_index = TransactionIndex(); self.block_heights = {}; self.balances = {}; self.account_sequences = {}; self.chain_stats = ChainStats()
+        for block in self.chain: self._index_block(block)
+    def _index_block(self, block):
+        """Updates the block-hash and confirmed-id indexes, the balance ledger, the per-sender sequence table and the running stats for one block."""
+        self.tx_index.add_block(block); self.block_heights[block.hash] = block.index; self.chain_stats.add_block(block, self.fee_of)
+        for tx in block.transactions:
+            sender, recipient = tx.get('sender'), tx.get('recipient')
+            self.balances[sender] = self.balances.get(sender, 0.0) - tx.get('amount', 0)
+            self.balances[sender] -= self.fee_of(tx.get('fee')) # Also deduct the fee
+            self.balances[recipient] = self.balances.get(recipient, 0.0) + tx.get('amount', 0)
+            if tx.get('sequence') is not None: self.account_sequences[sender] = tx['sequence'] + 1
+    @writes
+    def append_block(self, block):
+        """Adds a newly forged or minted block to the chain, its indexes and the store."""
+        if self.read_only: raise RuntimeError("a read-only follower cannot append blocks")
+        self.chain.append(block); self._index_block(block); self.save_chain_to_disk(); self._announce_block(block)
+    def _announce_block(self, block):
+        """Encodes a new block for the response cache, publishes a 'block' event and, for artifact blocks, a 'mint' event."""
+        self.block_json.put(block)
+        self.events.publish('block', dict(block.header(), transaction_count=len(block.transactions)))
+        if isinstance(block.data, dict) and block.data.get('puzzle_type') and block.transactions and block.transactions[0].get('sender') == "MINT_REWARD":
+            reward = block.transactions[0]
+            self.events.publish('mint', {'index': block.index, 'hash': block.hash, 'solver': reward.get('recipient'), 'reward': reward.get('amount'), 'next_puzzle': block.data})
+    def _announce_mempool(self):
+        self.events.publish('mempool', {'count': len(self.mempool), 'bytes': self.mempool.bytes})
+    @reads
+    def snapshot(self):
+        """A consistent copy of the chain. Blocks never change once appended, so the copy stays valid after the lock is released."""
+        return list(self.chain)
+    @reads
+    def get_blocks(self, start, stop):
+        """Blocks with index in [start, stop); a slice, so only that range is copied."""
+        return self.chain[start:stop]
+    @reads
+    def get_stats(self):
+        """Chain-wide totals in constant time: the running ChainStats plus the ledger's address count and the mempool depth."""
+        addresses = len(self.balances) - sum(1 for sender in SYSTEM_SENDERS if sender in self.balances)
+        return dict(self.chain_stats.to_dict(), address_count=addresses, mempool={'count': len(self.mempool), 'bytes': self.mempool.bytes})
+    @reads
+    def locate(self, hashes):
+        """The block for the first of `hashes` that is on this chain (newest first, as in a block locator), or None."""
+        for block_hash in hashes:
+            index = self.block_heights.get(block_hash)
+            if index is not None and index < len(self.chain): return self.chain[index]
+        return None
+    @reads
+    def get_block(self, ref):
+        """Looks a block up by index (an int or a string of digits) or by hash; returns None if there is no such block."""
+        index = int(ref) if isinstance(ref, int) or ref.isdecimal() else self.block_heights.get(ref)
+        return self.chain[index] if index is not None and index < len(self.chain) else None
+    @property
+    def height(self): return len(self.chain)
     @property
     def latest_block(self): return self.chain[-1]
+    @property
+    def pending_transactions(self): return list(self.mempool)
+    def fee_of(self, fee):
+        """Transactions that don't name a fee pay the flat network fee."""
+        return self.transaction_fee if fee is None else fee
     
     # --- NEW HELPER METHOD ---
+    @reads
     def get_balance(self, address):
-        """Calculates the balance of an address by iterating through all confirmed blocks."""
-        balance = 0.0
-        for block in self.chain:
-            for tx in block.transactions:
-                if tx.get('sender') == address:
-                    balance -= tx.get('amount', 0)
-                    balance -= self.transaction_fee # Also deduct the fee
-                if tx.get('recipient') == address:
-                    balance += tx.get('amount', 0)
-        return balance
-
-    # UPDATED to perform validation, INCLUDING BALANCE CHECK
+        """The confirmed balance of an address, read from the ledger kept up to date by append_block."""
+        return self.balances.get(address, 0.0)
+
+    @reads
+    def expected_sequence(self, sender):
+        """The sequence number the next transaction from `sender` must carry, counting its pending ones."""
+        pending_next = self.mempool.next_sequence(sender)
+        return pending_next if pending_next is not None else self.account_sequences.get(sender, 0)
+
     def add_transaction(self, transaction):
-        if not Transaction.is_valid(transaction):
-            print("Transaction validation failed: Invalid signature.")
-            return False
-        
-        sender_balance = self.get_balance(transaction.sender)
-        if sender_balance < (transaction.amount + self.transaction_fee):
-            print(f"Transaction validation failed: Insufficient funds for sender {transaction.sender[:10]}...")
-            print(f"  Required: {transaction.amount + self.transaction_fee}, Available: {sender_balance}")
-            return False
-            
-        self.pending_transactions.append(transaction)
-        return True
+        accepted, _ = self.add_transactions([transaction])[0]
+        return accepted
+
+    def add_transactions(self, transactions):
+        """
+        Validates and admits transactions, returning an (accepted, reason) pair for each.
+        The whole batch shares one set of signature checks (parallel for large batches), run before the write
+        lock is taken so queries carry on while it verifies. Under the lock, duplicates are checked again and
+        the balance and sequence checks are O(1) lookups in the ledger and the mempool's per-sender state,
+        so each accepted transaction is already counted against its sender when the next one is checked.
+        """
+        # Duplicate and replay checks are O(1) and run before any ECDSA work. Copies of one id within the batch
+        # are all verified: the id leaves the signature out, so the first copy may be the one with a bad signature.
+        tx_ids = [transaction.calculate_id() for transaction in transactions]
+        reasons = [self._duplicate_reason(tx_id) for tx_id in tx_ids]
+        unchecked = [i for i, reason in enumerate(reasons) if reason is None]
+        for i, valid in zip(unchecked, Transaction.are_valid([transactions[i] for i in unchecked])):
+            if not valid: reasons[i] = "Invalid signature."
+
+        with self.lock.write():
+            for i, transaction in enumerate(transactions):
+                # Checked again: another batch, or an earlier copy in this one, may have been admitted since
+                if reasons[i] is None:
+                    # One malformed transaction must not abort the rest of the batch halfway through admitting it
+                    try: reasons[i] = self._duplicate_reason(tx_ids[i]) or self._admit(tx_ids[i], transaction)
+                    except Exception as e: reasons[i] = f"Internal error during validation: {e}"
+                if reasons[i]: print(f"Transaction validation failed: {reasons[i]}")
+            if any(reason is None for reason in reasons): self._announce_mempool()
+        return [(reason is None, reason) for reason in reasons]
+
+    def _duplicate_reason(self, tx_id):
+        if tx_id in self.mempool: return f"{tx_id[:10]}... is already pending."
+        if self.is_confirmed(tx_id): return f"{tx_id[:10]}... is already confirmed (replay)."
+        return None
 
+    def _admit(self, tx_id, transaction):
+        """Fee, amount, sequence and balance checks for a signature-checked transaction; returns a rejection reason or None."""
+        if not isinstance(transaction.recipient, str) or len(transaction.recipient) > MAX_ADDRESS_LENGTH: return f"Recipient must be an address string of at most {MAX_ADDRESS_LENGTH} characters."
+        if not is_finite_number(transaction.amount) or transaction.amount <= 0: return "Amount must be a positive number."
+        fee = self.fee_of(transaction.fee)
+        if not is_finite_number(fee) or fee < self.transaction_fee: return f"Fee {fee} is below the network minimum of {self.transaction_fee}."
+        if transaction.sequence is not None:
+            expected = self.expected_sequence(transaction.sender)
+            if isinstance(transaction.sequence, bool) or not isinstance(transaction.sequence, int) or transaction.sequence != expected: return f"Sequence {transaction.sequence} is out of order; expected {expected}."
+        # Pending transactions count against the sender too, so the same funds can't be spent twice in the mempool
+        available = self.get_balance(transaction.sender) - self.mempool.pending_debit(transaction.sender)
+        if available < (transaction.amount + fee): return f"Insufficient funds for sender {transaction.sender[:10]}... Required: {transaction.amount + fee}, Available: {available}"
+        # Anything bigger than a block could never be mined and would only sit in the pool until it expires
+        size = transaction.size()
+        if size > self.max_block_bytes: return f"Transaction is {size} bytes; a block holds at most {self.max_block_bytes}."
+        if not self.mempool.add(tx_id, transaction, fee, size): return "The mempool is full of higher-fee transactions."
+        return None
+
+    @writes
+    def take_pending_transactions(self):
+        """
+        Expires stale entries, then removes and returns the pending transactions that earn the most fees
+        while staying within max_block_transactions and max_block_bytes, along with their total fees.
+        Whatever doesn't fit stays pending for a later block.
+        """
+        expired = self.mempool.expire()
+        entries = self.mempool.select(self.max_block_transactions, self.max_block_bytes, lambda sender: self.account_sequences.get(sender, 0))
+        self.mempool.remove(entry.tx_id for entry in entries)
+        now = time.time(); self.confirmation_latencies.extend(now - entry.arrival for entry in entries)
+        if entries or expired: self._announce_mempool()
+        return [entry.transaction for entry in entries], sum(entry.fee for entry in entries)
+
+    @writes
     def forge_transaction_block(self, forger_address):
-        if not self.pending_transactions: print("No pending transactions to forge."); return None
+        pending, total_fees = self.take_pending_transactions()
+        if not pending: print("No pending transactions to forge."); return None
         print(f"Forger {forger_address[:10]}... is forging a new transaction block.")
-        total_fees = len(self.pending_transactions) * self.transaction_fee
         fee_tx = Transaction(sender="NETWORK_FEES", recipient=forger_address, amount=total_fees)
-        all_transactions = [fee_tx] + self.pending_transactions # Now a list of objects
-        new_block = Block(index=len(self.chain), transactions=[vars(tx) for tx in all_transactions], timestamp=time.time(), previous_hash=self.latest_block.hash, data={"type": "TRANSACTION_BLOCK", "forged_by": forger_address})
-        self.chain.append(new_block); self.pending_transactions = []; self.save_chain_to_disk(); print(f"Success! Transaction Block #{new_block.index} forged."); return new_block
+        all_transactions = [fee_tx] + pending # Now a list of objects
+        new_block = Block(index=len(self.chain), transactions=[tx.to_dict() for tx in all_transactions], timestamp=time.time(), previous_hash=self.latest_block.hash, data={"type": "TRANSACTION_BLOCK", "forged_by": forger_address}, version=BLOCK_VERSION)
+        self.append_block(new_block); print(f"Success! Transaction Block #{new_block.index} forged."); return new_block
 
+    @writes
     def attempt_mint(self, solver_wallet, proposed_solution):
         # ... (This logic is correct and remains the same)
         latest_block_data = self.latest_block.data; puzzle_type = latest_block_data.get('puzzle_type')
@@ -125,18 +445,63 @@ class Blockchain:
             except (ValueError, TypeError): return None
         if not is_solution_correct: print("Failed Mint Attempt: Incorrect solution."); return None
         print("Solution Correct! Forging new ARTIFACT block...")
-        artifact_block_count = sum(1 for b in self.chain if b.data.get('puzzle_type')); next_difficulty_level = artifact_block_count + 1
+        next_difficulty_level = self.chain_stats.artifact_blocks + 1
         previous_block_hash_as_seed = self.latest_block.hash; next_puzzle_package = self.puzzle_master.create_new_puzzle(difficulty_level=next_difficulty_level, seed=previous_block_hash_as_seed)
-        total_reward = 1 + (len(self.pending_transactions) * self.transaction_fee)
-        all_transactions = [Transaction(sender="MINT_REWARD", recipient=solver_wallet.address, amount=total_reward)] + self.pending_transactions
-        new_block = Block(index=len(self.chain), transactions=[vars(tx) for tx in all_transactions], timestamp=time.time(), previous_hash=self.latest_block.hash, data=next_puzzle_package)
-        self.chain.append(new_block); self.pending_transactions = []; self.save_chain_to_disk(); print(f"Success! Artifact Block #{new_block.index} created."); return new_block
+        pending, total_fees = self.take_pending_transactions()
+        total_reward = 1 + total_fees
+        all_transactions = [Transaction(sender="MINT_REWARD", recipient=solver_wallet.address, amount=total_reward)] + pending
+        new_block = Block(index=len(self.chain), transactions=[tx.to_dict() for tx in all_transactions], timestamp=time.time(), previous_hash=self.latest_block.hash, data=next_puzzle_package, version=BLOCK_VERSION)
+        self.append_block(new_block); print(f"Success! Artifact Block #{new_block.index} created."); return new_block
+
+    @reads
+    def find_transaction(self, tx_id):
+        """Returns (block, position) of a confirmed transaction, or (None, None)."""
+        for block_index, position in self.tx_index.candidates(tx_id):
+            block = self.chain[block_index]
+            if block.transaction_id(position) == tx_id: return block, position
+        return None, None
+
+    def is_confirmed(self, tx_id): return self.find_transaction(tx_id)[0] is not None
+
+    @reads
+    def get_transaction_proof(self, tx_id):
+        """Builds a Merkle inclusion proof for a confirmed transaction in a Merkle-committed block; `leaf` is where the path starts."""
+        block, position = self.find_transaction(tx_id)
+        if block is None or block.version < MERKLE_BLOCK_VERSION: return None
+        leaves = block.merkle_leaves()
+        return {'tx_id': tx_id, 'leaf': leaves[position], 'block': block.header(), 'position': position, 'proof': merkle_proof(leaves, position, block.duplicates_odd_merkle_nodes)}
+
+    @reads
+    def get_addresses_data(self, addresses, include_transactions=False, max_transactions=None):
+        """
+        get_address_data for many addresses in a single pass over the chain, so a bulk report costs O(chain)
+        rather than O(addresses x chain). Balances and counts follow get_address_data exactly; with
+        include_transactions each address also gets its transactions (only the latest max_transactions if set).
+        """
+        wanted = dict.fromkeys(addresses)
+        balances, counts = dict.fromkeys(wanted, 0.0), dict.fromkeys(wanted, 0)
+        txs = {address: deque(maxlen=max_transactions) for address in wanted} if include_transactions else None
+        for block in self.chain:
+            for tx_data in block.transactions:
+                sender, recipient = tx_data.get('sender'), tx_data.get('recipient')
+                if sender in balances:
+                    balances[sender] -= tx_data.get('amount', 0); counts[sender] += 1
+                    if txs is not None: txs[sender].append(tx_data)
+                if recipient in balances:
+                    balances[recipient] += tx_data.get('amount', 0); counts[recipient] += 1
+                    if txs is not None: txs[recipient].append(tx_data)
+        results = {}
+        for address in wanted:
+            results[address] = {'address': address, 'balance': balances[address], 'transaction_count': counts[address], 'next_sequence': self.expected_sequence(address)}
+            if txs is not None: results[address]['transactions'] = list(txs[address])
+        return results
 
+    @reads
     def get_address_data(self, address):
         txs, balance = [], 0.0
         for block in self.chain:
             for tx_data in block.transactions:
                 if tx_data.get('sender') == address: balance -= tx_data.get('amount', 0); txs.append(tx_data)
                 if tx_data.get('recipient') == address: balance += tx_data.get('amount', 0); txs.append(tx_data)
-        return {'address': address, 'balance': balance, 'transactions': txs, 'transaction_count': len(txs)}
+        return {'address': address, 'balance': balance, 'transactions': txs, 'transaction_count': len(txs), 'next_sequence': self.expected_sequence(address)}
 
@@ -0,0 +1,127 @@
+"""
+ECDSA backend selection for C3301.
+
+Keys and signatures use the python-ecdsa encodings the chain has always used: NIST384p, 48-byte raw
+private keys, 96-byte raw x||y public keys (the address), and 96-byte raw r||s signatures over SHA-1.
+If the `cryptography` package (OpenSSL) is importable it does the actual work; otherwise, or when
+C3301_CRYPTO_BACKEND=ecdsa is set, the pure-Python `ecdsa` package is used. Both produce identical
+bytes, so existing addresses and signatures stay valid whichever backend a node runs.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from ecdsa import SigningKey, VerifyingKey, NIST384p, BadSignatureError
+
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature, encode_dss_signature
+    HAVE_OPENSSL = True
+except ImportError:
+    HAVE_OPENSSL = False
+
+KEY_SIZE = 48  # bytes per coordinate / scalar on NIST384p
+
+class EcdsaBackend:
+    """Pure-Python backend. Its key objects are python-ecdsa's own SigningKey/VerifyingKey."""
+    name = "ecdsa"
+    def generate(self): return SigningKey.generate(curve=NIST384p)
+    def signing_key(self, raw): return SigningKey.from_string(raw, curve=NIST384p)
+    def verifying_key(self, raw): return VerifyingKey.from_string(raw, curve=NIST384p)
+
+class _OpenSSLVerifyingKey:
+    def __init__(self, key): self._key = key
+    def to_string(self):
+        numbers = self._key.public_numbers()
+        return numbers.x.to_bytes(KEY_SIZE, 'big') + numbers.y.to_bytes(KEY_SIZE, 'big')
+    def verify(self, signature, data):
+        """Mirrors python-ecdsa: returns True or raises BadSignatureError."""
+        if len(signature) != 2 * KEY_SIZE: raise BadSignatureError("Invalid signature length")
+        r, s = int.from_bytes(signature[:KEY_SIZE], 'big'), int.from_bytes(signature[KEY_SIZE:], 'big')
+        try: self._key.verify(encode_dss_signature(r, s), data, ec.ECDSA(hashes.SHA1()))
+        except InvalidSignature: raise BadSignatureError("Signature verification failed")
+        return True
+
+class _OpenSSLSigningKey:
+    def __init__(self, key): self._key = key; self.verifying_key = _OpenSSLVerifyingKey(key.public_key())
+    def to_string(self): return self._key.private_numbers().private_value.to_bytes(KEY_SIZE, 'big')
+    def sign(self, data):
+        r, s = decode_dss_signature(self._key.sign(data, ec.ECDSA(hashes.SHA1())))
+        return r.to_bytes(KEY_SIZE, 'big') + s.to_bytes(KEY_SIZE, 'big')
+
+class OpenSSLBackend:
+    """`cryptography`/OpenSSL backend with key objects that duck-type python-ecdsa's."""
+    name = "openssl"
+    def generate(self): return _OpenSSLSigningKey(ec.generate_private_key(ec.SECP384R1()))
+    def signing_key(self, raw):
+        if len(raw) != KEY_SIZE: raise ValueError("Invalid private key length")
+        return _OpenSSLSigningKey(ec.derive_private_key(int.from_bytes(raw, 'big'), ec.SECP384R1()))
+    def verifying_key(self, raw):
+        if len(raw) != 2 * KEY_SIZE: raise ValueError("Invalid public key length")
+        return _OpenSSLVerifyingKey(ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP384R1(), b'\x04' + raw))
+
+def available_backends():
+    return [OpenSSLBackend(), EcdsaBackend()] if HAVE_OPENSSL else [EcdsaBackend()]
+
+def _select_backend():
+    requested = os.getenv('C3301_CRYPTO_BACKEND')
+    for candidate in available_backends():
+        if requested in (None, candidate.name): return candidate
+    print(f"Crypto backend '{requested}' is not available, falling back to python-ecdsa.")
+    return EcdsaBackend()
+
+backend = _select_backend()
+
+# --- Public API ---
+def generate_signing_key(): return backend.generate()
+def load_signing_key(private_key_hex): return backend.signing_key(bytes.fromhex(private_key_hex))
+
+@lru_cache(maxsize=4096)
+def load_verifying_key(public_key_hex):
+    """Parsing (and validating) a public key point is a large share of verify cost, so keys are cached per address."""
+    return backend.verifying_key(bytes.fromhex(public_key_hex))
+
+def verify(public_key_hex, signature_hex, data):
+    """Returns True if `signature_hex` is a valid signature of `data` by the address `public_key_hex`, raises otherwise."""
+    return load_verifying_key(public_key_hex).verify(bytes.fromhex(signature_hex), data)
+
+# --- Batch Verification ---
+PARALLEL_VERIFY_THRESHOLD = 32
+_verify_pool = None
+_verify_pool_lock = threading.Lock()
+
+def _verify_item(item):
+    try: return verify(*item)
+    except Exception: return False
+
+def _parallel_workers():
+    workers = os.cpu_count() or 1
+    return workers if workers >= 2 and 'fork' in multiprocessing.get_all_start_methods() else 0
+
+def start_verify_pool():
+    """
+    Creates the verification pool and forks its workers straight away. Call it before the server starts
+    any threads: a fork copies only the calling thread, so a lock another thread holds at that moment
+    stays locked forever in the children. Returns the pool, or None where batches are verified in-process.
+    """
+    global _verify_pool
+    workers = _parallel_workers()
+    if not workers: return None
+    with _verify_pool_lock:
+        if _verify_pool is None:
+            _verify_pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork'))
+            _verify_pool.submit(int).result()  # a fork pool starts all of its workers on the first submit
+    return _verify_pool
+
+def verify_many(items):
+    """
+    Verifies (public_key_hex, signature_hex, data) triples and returns a list of booleans.
+    Batches of PARALLEL_VERIFY_THRESHOLD or more are spread over a pool of forked worker processes.
+    """
+    workers = _parallel_workers()
+    if len(items) < PARALLEL_VERIFY_THRESHOLD or not workers: return [_verify_item(item) for item in items]
+    pool = _verify_pool or start_verify_pool()
+    return list(pool.map(_verify_item, items, chunksize=max(1, len(items) // (workers * 4))))
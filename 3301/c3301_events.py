@@ -0,0 +1,37 @@
+import queue
+import threading
+
+class EventHub:
+    """
+    In-process publish/subscribe hub behind GET /events. The blockchain publishes (event, data) pairs as
+    things happen and every subscriber gets its own bounded queue. publish() never blocks: a subscriber
+    that falls `max_queue` events behind loses its oldest ones rather than stalling a forge.
+    Subscribers can also bring their own queue-like object (e.g. one feeding an asyncio loop) whose put_nowait() never blocks.
+    """
+    def __init__(self, max_queue=256):
+        self.max_queue = max_queue
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self.published, self.dropped = 0, 0
+
+    def __len__(self): return len(self._subscribers)
+
+    def subscribe(self, subscriber=None):
+        subscriber = subscriber if subscriber is not None else queue.Queue(maxsize=self.max_queue)
+        with self._lock: self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock: self._subscribers.discard(subscriber)
+
+    def publish(self, event, data):
+        with self._lock: subscribers = list(self._subscribers)
+        self.published += 1
+        for subscriber in subscribers:
+            while True:
+                try: subscriber.put_nowait((event, data)); break
+                except queue.Full:
+                    try: subscriber.get_nowait(); self.dropped += 1
+                    except queue.Empty: pass
+
+    def stats(self): return {'subscribers': len(self._subscribers), 'published': self.published, 'dropped': self.dropped}
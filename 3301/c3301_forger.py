@@ -0,0 +1,45 @@
+import threading
+import time
+
+class AutoForger:
+    """
+    Seals transaction blocks without waiting for someone to call POST /forge.
+    A background thread forges a block as soon as the mempool holds `max_pending` transactions
+    or its oldest entry has waited `max_age` seconds, crediting the fees to `forger_address`.
+    """
+    def __init__(self, blockchain, forger_address, max_pending=100, max_age=30.0):
+        self.blockchain, self.forger_address, self.max_pending, self.max_age = blockchain, forger_address, max_pending, max_age
+        self.poll_interval = min(1.0, max_age / 4)
+        self._thread = None
+        self.blocks_forged, self.last_forged_at = 0, None
+        self.triggers = {'size': 0, 'age': 0}
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="auto-forger", daemon=True)
+            self._thread.start()
+        return self
+
+    def trigger_reason(self):
+        mempool = self.blockchain.mempool
+        with self.blockchain.lock.read():
+            if len(mempool) >= self.max_pending: return 'size'
+            if len(mempool) and mempool.stats()['oldest_age'] >= self.max_age: return 'age'
+        return None
+
+    def _run(self):
+        while True:
+            time.sleep(self.poll_interval)
+            reason = self.trigger_reason()
+            if reason is None: continue
+            try:
+                if self.blockchain.forge_transaction_block(self.forger_address):
+                    self.triggers[reason] += 1; self.blocks_forged += 1; self.last_forged_at = time.time()
+            except Exception as e: print(f"Auto-forger: failed to forge a block: {e}")
+
+    def stats(self):
+        with self.blockchain.lock.read(): latencies = sorted(self.blockchain.confirmation_latencies)
+        latency = {'samples': len(latencies)}
+        if latencies: latency.update({'mean': sum(latencies) / len(latencies), 'p50': latencies[len(latencies) // 2], 'p95': latencies[int(len(latencies) * 0.95)], 'max': latencies[-1]})
+        return {'policy': {'max_pending': self.max_pending, 'max_age': self.max_age, 'forger_address': self.forger_address},
+                'blocks_forged': self.blocks_forged, 'triggers': dict(self.triggers), 'last_forged_at': self.last_forged_at, 'confirmation_latency': latency}
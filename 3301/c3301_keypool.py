@@ -0,0 +1,47 @@
+import queue
+import threading
+import time
+import c3301_crypto
+
+class KeyPool:
+    """
+    Keeps a bounded pool of freshly generated signing keys so /wallet can hand one out
+    without paying for key generation on the request thread.
+    A single background thread refills the pool, generating at most `refill_rate` keys per second.
+    """
+    def __init__(self, size=32, refill_rate=10.0):
+        self.size, self.refill_rate = size, refill_rate
+        self._keys = queue.Queue(maxsize=size)
+        self._wakeup = threading.Event()
+        self._thread = None
+        self.generated, self.served, self.misses = 0, 0, 0
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._refill_loop, name="key-pool", daemon=True)
+            self._thread.start()
+        return self
+
+    def _refill_loop(self):
+        min_interval = 1.0 / self.refill_rate
+        while True:
+            if self._keys.full():
+                # Sleep until a key is taken; the timeout is only a safety net
+                self._wakeup.wait(timeout=5); self._wakeup.clear(); continue
+            started = time.time()
+            self._keys.put(c3301_crypto.generate_signing_key()); self.generated += 1
+            # Rate limit refills so a drained pool doesn't turn into a CPU spike
+            remaining = min_interval - (time.time() - started)
+            if remaining > 0: time.sleep(remaining)
+
+    def get(self):
+        """Pops a pre-generated key, falling back to generating one inline if the pool is empty."""
+        try:
+            key = self._keys.get_nowait()
+        except queue.Empty:
+            self.misses += 1; key = c3301_crypto.generate_signing_key()
+        self.served += 1; self._wakeup.set()
+        return key
+
+    def stats(self):
+        return {'depth': self._keys.qsize(), 'capacity': self.size, 'refill_rate': self.refill_rate, 'generated': self.generated, 'served': self.served, 'misses': self.misses}
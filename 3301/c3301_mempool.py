@@ -0,0 +1,233 @@
+import heapq
+import itertools
+import json
+import os
+import time
+
+class MempoolEntry:
+    __slots__ = ('tx_id', 'transaction', 'fee', 'size', 'arrival', 'order', 'sender', 'debit', 'account_sequence')
+    def __init__(self, tx_id, transaction, fee, size, arrival, order):
+        self.tx_id, self.transaction, self.fee, self.size, self.arrival, self.order = tx_id, transaction, fee, size, arrival, order
+        self.sender, self.debit, self.account_sequence = transaction.sender, transaction.amount + fee, transaction.sequence
+
+class SenderState:
+    """What one sender has pending: how many entries, the total it will be debited and its pending sequence numbers (always contiguous)."""
+    __slots__ = ('count', 'debit', 'sequences', 'next_sequence')
+    def __init__(self): self.count, self.debit, self.sequences, self.next_sequence = 0, 0.0, {}, None
+
+class MempoolJournal:
+    """
+    Append-only journal of mempool admissions and removals, so pending transactions survive a restart.
+    Each line is one JSON record. 'add' records carry the transaction together with the verdict it was
+    admitted with, so a restart doesn't have to verify the signature again.
+    """
+    def __init__(self, path): self.path = path; self._file = None; self.records = 0; self._follow_inode = None; self._follow_offset = 0
+
+    def _append(self, record):
+        if self._file is None: self._file = open(self.path, 'a')
+        self._file.write(json.dumps(record) + "\n"); self._file.flush(); self.records += 1
+
+    @staticmethod
+    def _add_record(entry): return {"op": "add", "id": entry.tx_id, "tx": entry.transaction.to_dict(), "fee": entry.fee, "size": entry.size, "arrival": entry.arrival, "verified": True}
+    def record_add(self, entry): self._append(self._add_record(entry))
+    def record_remove(self, tx_ids):
+        if tx_ids: self._append({"op": "remove", "ids": list(tx_ids)})
+
+    def replay(self):
+        """Returns the 'add' records still live at the end of the journal, in arrival order."""
+        live = {}
+        if not os.path.exists(self.path): return []
+        with open(self.path, 'r') as f:
+            for line in f:
+                try: record = json.loads(line)
+                except ValueError: continue  # a torn final line from a crash mid-write
+                if record.get('op') == 'add': live[record['id']] = record
+                elif record.get('op') == 'remove':
+                    for tx_id in record['ids']: live.pop(tx_id, None)
+        return list(live.values())
+
+    def follow(self):
+        """
+        For read-only followers of another process's journal. Returns (reset, records) for the complete lines
+        written since the last call; reset is True when the journal was compacted (replaced) in the meantime,
+        in which case records is the whole live set and the follower should start over from it.
+        """
+        try: stat = os.stat(self.path)
+        except FileNotFoundError: return False, []
+        reset = stat.st_ino != self._follow_inode or stat.st_size < self._follow_offset
+        if reset: self._follow_inode, self._follow_offset = stat.st_ino, 0
+        if stat.st_size == self._follow_offset: return reset, []
+        with open(self.path, 'rb') as f: f.seek(self._follow_offset); chunk = f.read()
+        complete = chunk[:chunk.rfind(b"\n") + 1]  # leave a half-written last line for next time
+        self._follow_offset += len(complete)
+        records = []
+        for line in complete.splitlines():
+            try: records.append(json.loads(line))
+            except ValueError: continue
+        return reset, records
+
+    def rewrite(self, entries):
+        """Compacts the journal down to one 'add' record per live entry."""
+        if self._file is not None: self._file.close(); self._file = None
+        temp_path, written = self.path + ".tmp", 0
+        with open(temp_path, 'w') as f:
+            for entry in entries: f.write(json.dumps(self._add_record(entry)) + "\n"); written += 1
+        os.replace(temp_path, self.path)
+        self.records = written
+
+class Mempool:
+    """
+    Bounded pool of pending transactions, prioritised by fee and then by arrival order.
+
+    The `_worst` heap pops the lowest-priority entry for eviction. Removals are lazy; heap items
+    whose transaction has already left the pool are skipped and the heap is rebuilt once it is
+    mostly stale. Entries older than `ttl` seconds are expired in arrival order, and select()
+    packs the next block.
+
+    Per-sender state makes pending debits and the next expected sequence number O(1) lookups.
+    A sender's sequenced transactions stay contiguous: evicting or expiring one also drops the
+    ones that follow it, since they could never be mined.
+    """
+    def __init__(self, max_count=5000, max_bytes=5_000_000, ttl=3 * 3600, journal=None):
+        self.max_count, self.max_bytes, self.ttl, self.journal = max_count, max_bytes, ttl, journal
+        self.entries = {}  # tx_id -> MempoolEntry, in arrival order
+        self.senders = {}  # sender -> SenderState
+        self.bytes = 0
+        self._worst = []
+        self._order = itertools.count()
+        self.evicted, self.expired = 0, 0
+
+    def __len__(self): return len(self.entries)
+    def __contains__(self, tx_id): return tx_id in self.entries
+    def __iter__(self): return (entry.transaction for entry in list(self.entries.values()))
+
+    def pending_debit(self, sender):
+        state = self.senders.get(sender)
+        return state.debit if state else 0.0
+
+    def next_sequence(self, sender):
+        """The sequence number a new transaction from `sender` must carry, or None if it has none pending."""
+        state = self.senders.get(sender)
+        return state.next_sequence if state else None
+
+    def add(self, tx_id, transaction, fee, size, arrival=None):
+        """Admits a transaction, evicting lower-priority ones if the pool is full. Returns False if it doesn't make the cut."""
+        if tx_id in self.entries: return False
+        if size > self.max_bytes: return False
+        entry = MempoolEntry(tx_id, transaction, fee, size, arrival or time.time(), next(self._order))
+        victims = []
+        while len(self.entries) - len(victims) + 1 > self.max_count or self.bytes - sum(v.size for v in victims) + size > self.max_bytes:
+            worst = self._pop_worst()
+            # Never evict the new entry's own predecessor; it would be orphaned on arrival
+            if worst is None or (worst.fee, -worst.order) >= (fee, -entry.order) or self._precedes(worst, entry):
+                self._push_worst_back(victims + ([worst] if worst else [])); return False
+            victims.append(worst)
+        evicted = self._remove_with_successors([victim.tx_id for victim in victims]); self.evicted += len(evicted)
+        self.entries[tx_id] = entry; self.bytes += size
+        state = self.senders.setdefault(entry.sender, SenderState()); state.count += 1; state.debit += entry.debit
+        if entry.account_sequence is not None: state.sequences[entry.account_sequence] = tx_id; state.next_sequence = entry.account_sequence + 1
+        heapq.heappush(self._worst, (fee, -entry.order, tx_id))
+        if self.journal:
+            self.journal.record_remove([e.tx_id for e in evicted]); self.journal.record_add(entry)
+        return True
+
+    @staticmethod
+    def _precedes(entry, other):
+        return entry.sender == other.sender and entry.account_sequence is not None and other.account_sequence is not None and entry.account_sequence < other.account_sequence
+
+    def _pop_worst(self):
+        """Pops the lowest-priority live entry off the eviction heap (it is pushed back if the eviction is abandoned)."""
+        while self._worst:
+            fee, neg_order, tx_id = heapq.heappop(self._worst)
+            entry = self.entries.get(tx_id)
+            if entry is not None and entry.order == -neg_order: return entry
+        return None
+
+    def _push_worst_back(self, entries):
+        for entry in entries: heapq.heappush(self._worst, (entry.fee, -entry.order, entry.tx_id))
+
+    def _remove(self, tx_id):
+        entry = self.entries.pop(tx_id, None)
+        if entry is None: return None
+        self.bytes -= entry.size
+        state = self.senders[entry.sender]; state.count -= 1; state.debit -= entry.debit
+        if entry.account_sequence is not None:
+            del state.sequences[entry.account_sequence]
+            if state.next_sequence == entry.account_sequence + 1: state.next_sequence = entry.account_sequence if state.sequences else None
+        if state.count == 0: del self.senders[entry.sender]
+        return entry
+
+    def _remove_with_successors(self, tx_ids):
+        """Removes entries and, for sequenced ones, every later-sequenced entry from the same sender."""
+        removed = []
+        for tx_id in tx_ids:
+            entry = self._remove(tx_id)
+            if entry is None: continue
+            removed.append(entry)
+            state = self.senders.get(entry.sender)
+            if entry.account_sequence is not None and state:
+                for sequence in sorted((s for s in state.sequences if s > entry.account_sequence), reverse=True):
+                    removed.append(self._remove(state.sequences[sequence]))
+        return removed
+
+    def remove(self, tx_ids, cascade=False):
+        """Removes entries (e.g. once they are in a block). With cascade, later-sequenced entries from the same senders go too."""
+        removed = self._remove_with_successors(tx_ids) if cascade else [entry for entry in (self._remove(tx_id) for tx_id in tx_ids) if entry is not None]
+        self._maybe_compact()
+        if self.journal:
+            self.journal.record_remove([entry.tx_id for entry in removed])
+            if self.journal.records > 2 * len(self.entries) + 1000: self.journal.rewrite(self.entries.values())
+        return removed
+
+    def select(self, max_count, max_bytes, confirmed_sequence=lambda sender: 0):
+        """
+        Chooses the entries for the next block, aiming to maximise total fees within both limits.
+        Exact knapsack is too slow for a request path, so two greedy packings are compared - by fee per
+        byte and by absolute fee - and the richer one wins (the standard 1/2-approximation).
+        A sequenced transaction is only taken once its predecessor is confirmed (per `confirmed_sequence`)
+        or already chosen. Entries are left in the pool; remove() them once the block is built.
+        """
+        by_density = self._greedy_pack(lambda e: e.fee / e.size, max_count, max_bytes, confirmed_sequence)
+        by_fee = self._greedy_pack(lambda e: e.fee, max_count, max_bytes, confirmed_sequence)
+        return max(by_density, by_fee, key=lambda entries: sum(e.fee for e in entries))
+
+    def _greedy_pack(self, priority, max_count, max_bytes, confirmed_sequence):
+        heap = [(-priority(e), e.order, e) for e in self.entries.values()]; heapq.heapify(heap)
+        chosen, used, next_sequences, waiting = [], 0, {}, {}
+        while heap and len(chosen) < max_count:
+            item = heapq.heappop(heap); entry = item[2]
+            if entry.account_sequence is not None:
+                expected = next_sequences.get(entry.sender)
+                if expected is None: expected = confirmed_sequence(entry.sender)
+                # Park it until its predecessor is chosen
+                if entry.account_sequence != expected: waiting[(entry.sender, entry.account_sequence)] = item; continue
+            # An entry that doesn't fit is skipped; smaller ones further down may still fit
+            if used + entry.size > max_bytes: continue
+            chosen.append(entry); used += entry.size
+            if entry.account_sequence is not None:
+                next_sequences[entry.sender] = entry.account_sequence + 1
+                released = waiting.pop((entry.sender, entry.account_sequence + 1), None)
+                if released: heapq.heappush(heap, released)
+        chosen.sort(key=lambda e: e.order)
+        return chosen
+
+    def expire(self, now=None):
+        """Drops entries older than the TTL. Entries are kept in arrival order, so this stops at the first fresh one."""
+        cutoff = (now or time.time()) - self.ttl
+        stale = []
+        for tx_id, entry in self.entries.items():
+            if entry.arrival > cutoff: break
+            stale.append(tx_id)
+        removed = self.remove(stale, cascade=True)
+        self.expired += len(removed)
+        return removed
+
+    def _maybe_compact(self):
+        live = len(self.entries)
+        if len(self._worst) > 2 * live + 64:
+            self._worst = [(e.fee, -e.order, e.tx_id) for e in self.entries.values()]; heapq.heapify(self._worst)
+
+    def stats(self):
+        oldest = next(iter(self.entries.values()), None)
+        return {'count': len(self.entries), 'bytes': self.bytes, 'max_count': self.max_count, 'max_bytes': self.max_bytes, 'ttl': self.ttl,
+                'senders': len(self.senders), 'oldest_age': time.time() - oldest.arrival if oldest else 0, 'evicted': self.evicted, 'expired': self.expired}
@@ -0,0 +1,50 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+
+class RateLimiter:
+    """
+    Token buckets per route: one per client IP and one shared by everyone. `rules` maps a route name to
+    (client_rate, client_burst, global_rate, global_burst), rates in requests per second; routes without
+    a rule are never limited.
+
+    A client's bucket is two numbers in an LRU keyed by (route, client). Once it has been idle long enough
+    to refill it is indistinguishable from a new one, so evicting the least recently used buckets beyond
+    `max_clients` costs nothing but memory churn under a flood of one-off addresses.
+    """
+    def __init__(self, rules, max_clients=100000):
+        self.rules, self.max_clients = rules, max_clients
+        self._buckets = OrderedDict()  # (route, client) -> [tokens, updated]
+        self._global = {route: [rule[3], time.monotonic()] for route, rule in rules.items()}
+        self._lock = threading.Lock()
+        self.limited = 0
+
+    @staticmethod
+    def _refill(bucket, rate, burst, now):
+        bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate); bucket[1] = now
+        return 0.0 if bucket[0] >= 1 else (1 - bucket[0]) / rate
+
+    def check(self, route, client):
+        """Takes a token for `client` on `route`. Returns 0 if the request may go ahead, otherwise the seconds until it could."""
+        rule = self.rules.get(route)
+        if rule is None: return 0.0
+        client_rate, client_burst, global_rate, global_burst = rule
+        now = time.monotonic()
+        with self._lock:
+            key = (route, client)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [client_burst, now]
+                if len(self._buckets) > self.max_clients: self._buckets.popitem(last=False)
+            else: self._buckets.move_to_end(key)
+            shared = self._global[route]
+            wait = max(self._refill(bucket, client_rate, client_burst, now), self._refill(shared, global_rate, global_burst, now))
+            if wait: self.limited += 1; return wait
+            bucket[0] -= 1; shared[0] -= 1
+            return 0.0
+
+    @staticmethod
+    def retry_after_header(wait): return str(max(1, math.ceil(wait)))
+
+    def stats(self): return {'tracked_clients': len(self._buckets), 'max_clients': self.max_clients, 'limited': self.limited, 'routes': {route: dict(zip(('client_rate', 'client_burst', 'global_rate', 'global_burst'), rule)) for route, rule in self.rules.items()}}
@@ -0,0 +1,74 @@
+import functools
+import threading
+from contextlib import contextmanager
+
+class ReadWriteLock:
+    """
+    Lets any number of readers in at once, or a single writer. Waiting writers block new readers so a
+    steady stream of queries can't starve forging. Both sides are re-entrant per thread and the writing
+    thread may also read; upgrading a read to a write is refused because two upgraders would deadlock.
+    """
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers, self._writer, self._writer_depth, self._waiting_writers = 0, None, 0, 0
+        self._local = threading.local()
+
+    def acquire_read(self):
+        depth = getattr(self._local, 'reads', 0)
+        if depth == 0 and self._writer != threading.get_ident():
+            with self._cond:
+                while self._writer is not None or self._waiting_writers: self._cond.wait()
+                self._readers += 1
+            self._local.shared = True
+        elif depth == 0: self._local.shared = False  # reading inside our own write
+        self._local.reads = depth + 1
+
+    def release_read(self):
+        self._local.reads -= 1
+        if self._local.reads or not self._local.shared: return
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0: self._cond.notify_all()
+
+    def acquire_write(self):
+        me = threading.get_ident()
+        if self._writer == me: self._writer_depth += 1; return
+        if getattr(self._local, 'reads', 0): raise RuntimeError("cannot upgrade a read lock to a write lock")
+        with self._cond:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers: self._cond.wait()
+            finally: self._waiting_writers -= 1
+            self._writer, self._writer_depth = me, 1
+
+    def release_write(self):
+        self._writer_depth -= 1
+        if self._writer_depth: return
+        with self._cond:
+            self._writer = None; self._cond.notify_all()
+
+    @contextmanager
+    def read(self):
+        self.acquire_read()
+        try: yield
+        finally: self.release_read()
+
+    @contextmanager
+    def write(self):
+        self.acquire_write()
+        try: yield
+        finally: self.release_write()
+
+def reads(method):
+    """Runs a method under its instance's `lock` as a reader."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock.read(): return method(self, *args, **kwargs)
+    return wrapper
+
+def writes(method):
+    """Runs a method under its instance's `lock` as the single writer."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock.write(): return method(self, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,32 @@
+SYSTEM_SENDERS = ("MINT_REWARD", "NETWORK_FEES")
+
+class ChainStats:
+    """
+    Running totals over the confirmed chain, updated once per appended block so reading them is O(1).
+    `supply` is what ordinary addresses hold between them: coins minted to solvers, less the fees they
+    have paid out of it. Artifact blocks are the ones carrying a puzzle; the genesis block opens the first
+    puzzle but is not counted as a minted artifact.
+    """
+    def __init__(self):
+        self.height, self.supply, self.artifact_blocks = 0, 0.0, 0
+        self.transactions, self.volume, self.fees = 0, 0.0, 0.0
+        self.latest_hash, self.latest_timestamp = None, None
+
+    def add_block(self, block, fee_of):
+        self.height += 1; self.latest_hash, self.latest_timestamp = block.hash, block.timestamp
+        if isinstance(block.data, dict) and block.data.get('puzzle_type'): self.artifact_blocks += 1
+        for tx in block.transactions:
+            sender, recipient, amount = tx.get('sender'), tx.get('recipient'), tx.get('amount', 0)
+            if sender not in SYSTEM_SENDERS:
+                fee = fee_of(tx.get('fee'))
+                self.transactions += 1; self.volume += amount; self.fees += fee; self.supply -= amount + fee
+            if recipient not in SYSTEM_SENDERS: self.supply += amount
+
+    @property
+    def artifacts(self): return max(self.artifact_blocks - 1, 0)
+
+    def to_dict(self):
+        # The open puzzle was created at level artifact_blocks (see Blockchain.attempt_mint)
+        return {'height': self.height, 'total_supply': self.supply, 'artifacts': self.artifacts, 'difficulty_level': self.artifact_blocks,
+                'transaction_count': self.transactions, 'transaction_volume': self.volume, 'fees_paid': self.fees,
+                'latest_block_hash': self.latest_hash, 'latest_block_timestamp': self.latest_timestamp}
@@ -0,0 +1,96 @@
+import json
+import sqlite3
+import threading
+
+# --- Compact Encoding ---
+# Addresses, signatures and hashes are lowercase hex in memory and at the API, but raw bytes on disk.
+# Anything that doesn't round-trip through bytes.fromhex (e.g. "MINT_REWARD", the genesis "0") is stored as text.
+def to_blob(value):
+    if isinstance(value, str) and value and len(value) % 2 == 0:
+        try:
+            raw = bytes.fromhex(value)
+            if raw.hex() == value: return raw
+        except ValueError: pass
+    return value
+
+def from_blob(value): return value.hex() if isinstance(value, bytes) else value
+
+class AddressTable:
+    """
+    Interns addresses. Every distinct address gets one shared str object and a compact integer id,
+    so a 192-char public key is held once in memory and once on disk no matter how often it appears.
+    """
+    def __init__(self): self._ids = {}; self._addresses = []
+    def __len__(self): return len(self._addresses)
+    def intern(self, address):
+        if not isinstance(address, str): return address
+        return self._addresses[self.id_for(address)]
+    def id_for(self, address):
+        address_id = self._ids.get(address)
+        if address_id is None:
+            address_id = len(self._addresses); self._ids[address] = address_id; self._addresses.append(address)
+        return address_id
+    def address_for(self, address_id): return self._addresses[address_id]
+
+class BlockStore:
+    """
+    SQLite-backed block store. Blocks are appended one at a time instead of rewriting the whole chain,
+    addresses are stored once in their own table and referenced by id, and hex fields are stored as bytes.
+    The database runs in WAL mode so reader processes can follow it while the writer appends.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS addresses (id INTEGER PRIMARY KEY, key);
+        CREATE TABLE IF NOT EXISTS blocks (idx INTEGER PRIMARY KEY, version, timestamp, previous_hash, hash, merkle_root, nonce, data);
+        CREATE TABLE IF NOT EXISTS transactions (block_idx INTEGER, position INTEGER, sender INTEGER, recipient INTEGER, signature, body, PRIMARY KEY (block_idx, position));
+    """
+    def __init__(self, path, addresses):
+        self.path, self.addresses = path, addresses
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(self.SCHEMA)
+        self._stored_addresses = 0; self.sync_addresses()
+
+    def sync_addresses(self):
+        """Loads addresses stored since the last call (by this process or, for readers, by the writer)."""
+        for address_id, key in self.db.execute("SELECT id, key FROM addresses WHERE id >= ? ORDER BY id", (self._stored_addresses,)):
+            if self.addresses.id_for(from_blob(key)) != address_id: raise ValueError("address table is out of sync with the block store")
+        self._stored_addresses = len(self.addresses)
+
+    def height(self):
+        # Blocks are stored contiguously from 0, and MAX on the rowid key is a single index lookup where COUNT(*) scans the table
+        return self.db.execute("SELECT COALESCE(MAX(idx) + 1, 0) FROM blocks").fetchone()[0]
+
+    def load_blocks(self, start=0, end=None):
+        """
+        Yields stored blocks with index in [start, end), in the same dict form as vars(block).
+        Blocks are committed together with their transactions, so bounding both queries by an `end`
+        read beforehand gives a consistent view even while another process is appending.
+        """
+        end = self.height() if end is None else end
+        address = self.addresses.address_for
+        txs_by_block = {}
+        for block_idx, sender, recipient, signature, body in self.db.execute("SELECT block_idx, sender, recipient, signature, body FROM transactions WHERE block_idx >= ? AND block_idx < ? ORDER BY block_idx, position", (start, end)):
+            tx_data = {"sender": address(sender), "recipient": address(recipient)}; tx_data.update(json.loads(body)); tx_data["signature"] = from_blob(signature)
+            txs_by_block.setdefault(block_idx, []).append(tx_data)
+        for idx, version, timestamp, previous_hash, block_hash, root, nonce, data in self.db.execute("SELECT idx, version, timestamp, previous_hash, hash, merkle_root, nonce, data FROM blocks WHERE idx >= ? AND idx < ? ORDER BY idx", (start, end)):
+            yield {"index": idx, "transactions": txs_by_block.get(idx, []), "timestamp": timestamp, "previous_hash": from_blob(previous_hash), "data": json.loads(data), "nonce": nonce, "version": version, "merkle_root": from_blob(root), "hash": from_blob(block_hash)}
+
+    def append_blocks(self, blocks):
+        """Writes blocks (and any addresses they introduce) in a single SQLite transaction."""
+        with self._lock, self.db:
+            block_rows, tx_rows = [], []
+            for block in blocks:
+                block_rows.append((block.index, block.version, block.timestamp, to_blob(block.previous_hash), to_blob(block.hash), to_blob(block.merkle_root), block.nonce, json.dumps(block.data, sort_keys=True)))
+                for position, tx_data in enumerate(block.transactions):
+                    body = {k: v for k, v in tx_data.items() if k not in ("sender", "recipient", "signature")}
+                    tx_rows.append((block.index, position, self.addresses.id_for(tx_data["sender"]), self.addresses.id_for(tx_data["recipient"]), to_blob(tx_data.get("signature")), json.dumps(body, sort_keys=True, separators=(",", ":"))))
+            new_addresses = [(i, to_blob(self.addresses.address_for(i))) for i in range(self._stored_addresses, len(self.addresses))]
+            self.db.executemany("INSERT INTO addresses (id, key) VALUES (?, ?)", new_addresses)
+            self.db.executemany("INSERT INTO blocks VALUES (?, ?, ?, ?, ?, ?, ?, ?)", block_rows)
+            self.db.executemany("INSERT INTO transactions VALUES (?, ?, ?, ?, ?, ?)", tx_rows)
+            self._stored_addresses = len(self.addresses)
+
+    def clear(self):
+        """Drops all stored blocks. Addresses are kept so ids stay stable."""
+        with self._lock, self.db: self.db.execute("DELETE FROM transactions"); self.db.execute("DELETE FROM blocks")
@@ -18,7 +18,7 @@ document.addEventListener('DOMContentLoaded', () => {
     const updateResponseBox = data => { elements.apiResponseBox.textContent = JSON.stringify(data, null, 2); };
     const handleError = (context, error) => { console.error(`${context}:`, error); updateResponseBox({ error: error.message }); };
     const generateWallet = async () => { try { const data = await api.get('/wallet'); walletAddress = data.public_address; walletPrivateKey = data.private_key; elements.walletAddressSpan.textContent = walletAddress; elements.walletPrivateKeySpan.textContent = walletPrivateKey; elements.walletInfoDiv.style.display = 'block'; updateResponseBox(data); } catch (e) { handleError("Failed to generate wallet", e); } };
-    const refreshChain = async () => { try { const data = await api.get('/chain'); elements.blockchainViewDiv.innerHTML = ''; const latestBlock = data.chain.slice(-1)[0]; const blockEl = document.createElement('div'); blockEl.className = 'block-view'; const content = document.createElement('pre'); content.textContent = JSON.stringify(latestBlock, null, 2); blockEl.appendChild(content); elements.blockchainViewDiv.appendChild(blockEl); updateResponseBox({ message: `Chain refreshed. Length: ${data.length}` }); } catch (e) { handleError("Failed to refresh chain", e); } };
+    const refreshChain = async (quiet = false) => { try { const data = await api.get('/chain?from_tip=1&limit=1'); elements.blockchainViewDiv.innerHTML = ''; const latestBlock = data.chain[0]; const blockEl = document.createElement('div'); blockEl.className = 'block-view'; const content = document.createElement('pre'); content.textContent = JSON.stringify(latestBlock, null, 2); blockEl.appendChild(content); elements.blockchainViewDiv.appendChild(blockEl); if (!quiet) updateResponseBox({ message: `Chain refreshed. Length: ${data.length}` }); } catch (e) { handleError("Failed to refresh chain", e); } };
     
     // REWRITTEN to handle timestamp correctly
     const sendTransaction = async (event) => {
@@ -55,6 +55,14 @@ document.addEventListener('DOMContentLoaded', () => {
             updateResponseBox(result);
             elements.sendTxForm.reset();
 
+            // 4. Validation happens in the background; follow the status until it settles.
+            for (let attempt = 0; attempt < 20; attempt++) {
+                await new Promise(resolve => setTimeout(resolve, 250));
+                const status = await api.get(result.status_url);
+                updateResponseBox(status);
+                if (status.status !== 'queued') break;
+            }
+
         } catch (e) {
             handleError("Transaction failed", e);
         }
@@ -62,8 +70,13 @@ document.addEventListener('DOMContentLoaded', () => {
 
     const mintCoin = async (event) => { event.preventDefault(); if (!walletAddress) return alert('Please generate a wallet to receive the mint reward.'); const phrase = document.getElementById('secret-phrase').value; if (!phrase) return alert('Please enter a secret phrase.'); try { const result = await api.post('/mint', { solver_address: walletAddress, secret_phrase: phrase }); updateResponseBox(result); elements.mintForm.reset(); if (result.message.includes('New Block Forged')) await refreshChain(); } catch (e) { handleError("Minting failed", e); } };
     elements.generateWalletBtn.addEventListener('click', generateWallet);
-    elements.refreshChainBtn.addEventListener('click', refreshChain);
+    elements.refreshChainBtn.addEventListener('click', () => refreshChain());
     elements.sendTxForm.addEventListener('submit', sendTransaction);
     elements.mintForm.addEventListener('submit', mintCoin);
     refreshChain();
+    // New blocks are pushed by the server; redraw the latest block without touching the response box
+    const events = new EventSource('/events');
+    events.addEventListener('block', () => refreshChain(true));
+    // The stream is refused on servers that can't hold it open (sync workers); poll there instead
+    events.addEventListener('error', () => { if (events.readyState === EventSource.CLOSED) setInterval(() => refreshChain(true), 15000); });
 });
@@ -5,6 +5,7 @@ document.addEventListener('DOMContentLoaded', () => {
     const resultsSection = document.getElementById('results-section');
     const resultsView = document.getElementById('results-view');
     const latestBlocksView = document.getElementById('latest-blocks-view');
+    const networkStatus = document.getElementById('network-status');
 
     // --- API Helper ---
     const apiGet = async (endpoint) => {
@@ -42,26 +43,48 @@ document.addEventListener('DOMContentLoaded', () => {
         resultsSection.style.display = 'block';
     };
 
+    const LATEST_BLOCK_COUNT = 5;
+    const POLL_INTERVAL_MS = 15000;
+    let shownBlocks = []; // newest first
+
+    const renderBlocks = () => {
+        latestBlocksView.innerHTML = ''; // Clear previous view
+        shownBlocks.forEach(block => {
+            const blockElement = document.createElement('div');
+            blockElement.className = 'block-view';
+            blockElement.innerHTML = `
+                <h4>Block #${block.index}</h4>
+                <pre>${JSON.stringify(block, null, 2)}</pre>
+            `;
+            latestBlocksView.appendChild(blockElement);
+        });
+    };
+
     const loadLatestBlocks = async () => {
         try {
-            const data = await apiGet('/chain');
-            latestBlocksView.innerHTML = ''; // Clear previous view
-            // Show latest 5 blocks, or all if less than 5
-            const recentBlocks = data.chain.slice(-5).reverse();
-            recentBlocks.forEach(block => {
-                const blockElement = document.createElement('div');
-                blockElement.className = 'block-view';
-                blockElement.innerHTML = `
-                    <h4>Block #${block.index}</h4>
-                    <pre>${JSON.stringify(block, null, 2)}</pre>
-                `;
-                latestBlocksView.appendChild(blockElement);
-            });
+            // Only fetch the latest 5 blocks (newest first), not the whole chain
+            const data = await apiGet(`/chain?from_tip=1&limit=${LATEST_BLOCK_COUNT}`);
+            shownBlocks = data.chain;
+            renderBlocks();
         } catch (error) {
             latestBlocksView.innerHTML = `<p class="warning">Could not load chain data.</p>`;
             console.error(error);
         }
     };
+
+    // Fetches only the blocks after the newest one shown; falls back to a full reload after a fork or a long gap
+    const syncNewBlocks = async () => {
+        if (shownBlocks.length === 0) return loadLatestBlocks();
+        try {
+            const locator = shownBlocks.map(block => block.hash).join(',');
+            const data = await apiGet(`/chain/since/${shownBlocks[0].hash}?locator=${locator}&limit=${LATEST_BLOCK_COUNT}`);
+            if (data.fork || data.more) return loadLatestBlocks();
+            shownBlocks = data.chain.reverse().concat(shownBlocks).slice(0, LATEST_BLOCK_COUNT);
+            renderBlocks();
+        } catch (error) {
+            loadLatestBlocks();
+        }
+    };
     
     // --- Event Handlers ---
     const handleSearch = async (event) => {
@@ -78,6 +101,19 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     };
 
+    // --- Live Updates ---
+    // One long-lived connection instead of polling: fetch just the new blocks when one is added and show the mempool depth
+    const showMempool = (mempool) => { networkStatus.textContent = `Pending transactions: ${mempool.count}`; };
+    const events = new EventSource('/events');
+    events.addEventListener('status', (event) => showMempool(JSON.parse(event.data).mempool));
+    events.addEventListener('mempool', (event) => showMempool(JSON.parse(event.data)));
+    events.addEventListener('block', () => syncNewBlocks());
+    // The stream is refused on servers that can't hold it open (sync workers); fall back to polling there
+    events.addEventListener('error', () => {
+        if (events.readyState !== EventSource.CLOSED) return;
+        setInterval(async () => { syncNewBlocks(); try { showMempool((await apiGet('/stats')).mempool); } catch (error) { console.error(error); } }, POLL_INTERVAL_MS);
+    });
+
     // --- Initial Load ---
     searchForm.addEventListener('submit', handleSearch);
     loadLatestBlocks();
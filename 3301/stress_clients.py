@@ -0,0 +1,118 @@
+"""
+Concurrency stress test: runs minting, forging and transaction-submitting clients against one node
+from many threads at once, then checks the chain, ledger and block store are still consistent.
+
+It drives the Flask app in-process from a scratch directory, so it never touches a real chain file.
+
+    python stress_clients.py --minters 4 --forgers 2 --submitters 8 --seconds 20
+"""
+import os
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+from argparse import ArgumentParser
+from collections import Counter
+from c3301_stats import SYSTEM_SENDERS
+
+def solve(puzzle):
+    """Decrypts the cipher puzzles using their published clue; the solver's side of PuzzleMaster."""
+    text = re.search(r"'([^']*)'", puzzle.get('puzzle', ''))
+    if not text: return None
+    text, clue = text.group(1), puzzle.get('clue', '')
+    if 'shift key' in clue:
+        shift = int(clue.rsplit('=', 1)[1]); keys = [shift]
+    elif 'keyword' in clue:
+        keys = [ord(c) - ord('A') for c in re.search(r"'([^']*)'", clue).group(1)]
+    else: return None
+    return ''.join(chr((ord(c) - ord('A') - keys[i % len(keys)]) % 26 + ord('A')) if 'A' <= c <= 'Z' else c for i, c in enumerate(text))
+
+class Clients:
+    def __init__(self, app_module, wallets, deadline):
+        self.app, self.wallets, self.deadline = app_module, wallets, deadline
+        self.counts, self.errors, self._lock = Counter(), [], threading.Lock()
+
+    def record(self, key):
+        with self._lock: self.counts[key] += 1
+
+    def run(self, name, loop):
+        try:
+            client = self.app.app.test_client()
+            while time.time() < self.deadline: loop(client)
+        except Exception as e:
+            with self._lock: self.errors.append(f"{name}: {e!r}")
+
+    def mint(self, client):
+        wallet = random.choice(self.wallets)
+        latest = client.get('/chain?from_tip=1&limit=1').get_json()['chain'][0]
+        response = client.post('/mint', json={'solver_address': wallet.address, 'secret_phrase': solve(latest['data']) or 'wrong'})
+        self.record('mint_ok' if response.status_code == 200 else 'mint_rejected')
+
+    def forge(self, client):
+        response = client.post('/forge', json={'forger_address': random.choice(self.wallets).address})
+        self.record('forge_ok' if response.status_code == 200 else 'forge_empty')
+        time.sleep(0.05)
+
+    def submit(self, client, wallet):
+        from c3301_blockchain import Transaction
+        recipient = random.choice(self.wallets).address
+        sequence = client.get(f'/address/{wallet.address}').get_json()['next_sequence']
+        tx = Transaction(wallet.address, recipient, round(random.uniform(0.001, 0.05), 6), fee=0.001, sequence=sequence).sign(wallet.private_key)
+        response = client.post('/transactions/new', json=tx.to_payload())
+        self.record('submitted' if response.status_code == 202 else f'submit_{response.status_code}')
+
+    def read(self, client):
+        address = random.choice(self.wallets).address
+        assert client.get(f'/address/{address}').status_code == 200
+        assert client.get('/chain').status_code == 200
+        self.record('reads')
+
+def check(blockchain, reloaded):
+    """Returns a list of invariant violations (empty when the node survived intact)."""
+    problems, chain, seen = [], blockchain.snapshot(), set()
+    for i, block in enumerate(chain):
+        if block.index != i: problems.append(f"block {i} has index {block.index}")
+        if block.hash != block.calculate_hash(): problems.append(f"block {i} hash mismatch")
+        if i and block.previous_hash != chain[i - 1].hash: problems.append(f"block {i} does not link to block {i - 1}")
+        for tx_id in block.transaction_ids():
+            if tx_id in seen: problems.append(f"transaction {tx_id[:10]} confirmed twice")
+            seen.add(tx_id)
+    for address, balance in blockchain.balances.items():
+        if address not in SYSTEM_SENDERS and balance < -1e-9: problems.append(f"{address[:10]} overspent: {balance}")
+    if blockchain.store.height() != len(chain): problems.append(f"store holds {blockchain.store.height()} blocks, memory {len(chain)}")
+    if reloaded.latest_block.hash != chain[-1].hash: problems.append("chain reloaded from disk has a different tip")
+    if reloaded.balances != blockchain.balances: problems.append("ledger rebuilt from disk differs from the live ledger")
+    return problems
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Hammer one node with concurrent mint/forge/submit clients.')
+    parser.add_argument('--minters', type=int, default=4); parser.add_argument('--forgers', type=int, default=2)
+    parser.add_argument('--submitters', type=int, default=8); parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=20)
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(tempfile.mkdtemp(prefix='c3301-stress-'))
+    os.environ.setdefault('C3301_ADMISSION_WORKERS', '2'); os.environ.setdefault('C3301_RATE_LIMIT', '0')
+    import app as app_module
+    from c3301_blockchain import Blockchain, Wallet
+
+    wallets = [Wallet() for _ in range(args.submitters)]
+    clients = Clients(app_module, wallets, time.time() + args.seconds)
+    threads = [threading.Thread(target=clients.run, args=(f'minter-{i}', clients.mint)) for i in range(args.minters)]
+    threads += [threading.Thread(target=clients.run, args=(f'forger-{i}', clients.forge)) for i in range(args.forgers)]
+    threads += [threading.Thread(target=clients.run, args=(f'submitter-{i}', lambda c, w=w: clients.submit(c, w))) for i, w in enumerate(wallets)]
+    threads += [threading.Thread(target=clients.run, args=(f'reader-{i}', clients.read)) for i in range(args.readers)]
+    print(f"Running {len(threads)} clients for {args.seconds:.0f}s in {os.getcwd()}...")
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+    time.sleep(0.5)  # let the admission workers drain
+
+    blockchain = app_module.blockchain
+    problems = clients.errors + check(blockchain, Blockchain())
+    print(f"Height {len(blockchain.chain)}, {len(blockchain.mempool)} pending. " + ', '.join(f"{k}={v}" for k, v in sorted(clients.counts.items())))
+    if problems:
+        print("FAILED:"); [print(f"  {problem}") for problem in problems]; sys.exit(1)
+    print("OK: chain, ledger and block store are consistent.")